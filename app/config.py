@@ -1,5 +1,13 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+PlaybackMode = Literal["proxy", "redirect", "url"]
+# app.services.ffmpeg.ENCODING_PROFILES 의 key
+EncodingProfileName = Literal[
+    "aac-192k", "speech-mono-96k", "speech-mono-64k", "opus-mono-32k"
+]
+
 
 class Settings(BaseSettings):
     postgresql_url: str
@@ -17,5 +25,82 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
     openai_api_key: str
 
+    # DB 커넥션 풀
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_timezone: str = "Asia/Seoul"
+    slow_query_ms: int = 500
+    report_count_cache_seconds: int = 30
+    report_count_cache_size: int = 256
+
+    # 오디오 처리 파이프라인
+    audio_worker_concurrency: int = 4
+    audio_ffmpeg_concurrency: int = 2
+    ffmpeg_timeout_seconds: int = 900
+    audio_claim_batch_size: int = 20
+    audio_claim_lease_seconds: int = 1800
+    audio_lease_heartbeat_seconds: int = 300
+    audio_max_attempts: int = 3
+    # 업로드 알림을 놓친 파일을 위한 안전망 poll 주기
+    audio_poll_interval_minutes: int = 30
+    # True 이면 S3 -> ffmpeg -> S3 파이프로 변환 (로컬 임시 파일 미사용)
+    audio_streaming_transcode: bool = False
+    # 변환 프로파일: aac-192k | speech-mono-96k | speech-mono-64k | opus-mono-32k
+    audio_encoding_profile: EncodingProfileName = "aac-192k"
+    s3_multipart_chunk_mb: int = 8
+    s3_multipart_concurrency: int = 4
+    s3_presigned_expire_seconds: int = 3600
+    # 클라이언트 직접 업로드 (presigned POST)
+    s3_presigned_upload_expire_seconds: int = 900
+    audio_upload_max_mb: int = 500
+
+    # 재생용 오디오 on-disk LRU 캐시 (audio_cache_dir가 비어 있으면 사용 안함)
+    # 프로세스마다 audio_cache_dir/<pid> 를 사용하며 audio_cache_max_mb도 프로세스별 한도
+    audio_cache_dir: str = ""
+    audio_cache_max_mb: int = 2048
+    audio_cache_max_object_mb: int = 200
+    audio_stream_chunk_kb: int = 256
+    # /audio/webm/{id} 기본 응답 모드: proxy | redirect | url
+    audio_playback_mode: PlaybackMode = "proxy"
+    s3_presigned_playback_expire_seconds: int = 300
+    # 파형 peaks: 8kHz 기준 160 샘플 = 초당 50 bucket
+    audio_peaks_sample_rate: int = 8000
+    audio_peaks_samples_per_bucket: int = 160
+    audio_peaks_min_buckets: int = 1024
+
+    # 긴 녹음을 무음 구간에서 나눠 병렬 STT (sync completion에서만 사용)
+    stt_chunking_enabled: bool = False
+    stt_chunk_min_seconds: int = 900
+    stt_chunk_target_seconds: int = 300
+    stt_chunk_concurrency: int = 4
+    stt_chunk_max_retries: int = 2
+    stt_silence_noise_db: float = -35.0
+    stt_silence_min_seconds: float = 0.5
+
+    # STT 전 긴 무음 구간 제거 (stt_vad_keep_seconds 만큼은 남김)
+    stt_vad_enabled: bool = False
+    stt_vad_noise_db: float = -40.0
+    stt_vad_min_silence_seconds: float = 2.0
+    stt_vad_keep_seconds: float = 0.5
+
+    # Clova HTTP 클라이언트
+    clova_pool_size: int = 10
+    clova_connect_timeout: float = 5.0
+    clova_read_timeout: float = 900.0
+    clova_max_retries: int = 3
+    clova_backoff_seconds: float = 1.0
+    # True 이면 completion="async"로 요청하고 결과는 callback으로 수신
+    clova_async_completion: bool = False
+    # e.g. https://api.example.com/stt/clova/callback
+    clova_callback_url: str = ""
+    clova_callback_secret: str = ""
+    # callback 누락 대비 결과 조회 주기 / 조회 시작 대기 / 최대 대기
+    clova_result_poll_minutes: int = 10
+    clova_result_poll_grace_seconds: int = 300
+    clova_result_timeout_seconds: int = 21600
+
 
 settings = Settings()
@@ -1,28 +1,155 @@
 # import os
-from contextlib import contextmanager
+import time
+from contextlib import asynccontextmanager, contextmanager
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.config import settings
+from app.metrics import Histogram
 
 Base = declarative_base()
 
 
 class DBConnection:
-    def __init__(self, db_url):
-        self.engine = create_engine(db_url)
+    def __init__(
+        self,
+        db_url,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        timezone: str = "Asia/Seoul",
+    ):
+        # 타임존은 물리 커넥션 생성 시 startup 옵션으로 한 번만 설정
+        self.engine = create_engine(
+            db_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={"options": f"-c timezone={timezone}"},
+            # executemany를 psycopg2 execute_batch로 묶어 round-trip 절감
+            executemany_mode="values_plus_batch",
+        )
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
 
     @contextmanager
     def get_db(self):
         db_session = self.SessionLocal()
         try:
+            self._checkout(db_session)
             yield db_session
         finally:
             db_session.close()
 
+    def _checkout(self, db_session):
+        """풀에서 커넥션을 미리 가져오며 대기 시간을 기록"""
+        start = time.perf_counter()
+        try:
+            db_session.connection()
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe((time.perf_counter() - start) * 1000)
+
+    def pool_stats(self) -> dict:
+        """커넥션 풀 현황 및 checkout 대기 시간 통계"""
+        return _pool_stats(self)
+
+
+class AsyncDBConnection:
+    """asyncpg 기반 AsyncEngine 커넥션 (이벤트 루프를 막지 않음)"""
+
+    def __init__(
+        self,
+        db_url,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        timezone: str = "Asia/Seoul",
+    ):
+        self.engine = create_async_engine(
+            to_async_url(db_url),
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={"server_settings": {"timezone": timezone}},
+        )
+        self.SessionLocal = async_sessionmaker(
+            autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+
+    @asynccontextmanager
+    async def get_db(self):
+        async with self.SessionLocal() as db_session:
+            await self._checkout(db_session)
+            yield db_session
+
+    async def _checkout(self, db_session):
+        """풀에서 커넥션을 미리 가져오며 대기 시간을 기록"""
+        start = time.perf_counter()
+        try:
+            await db_session.connection()
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe((time.perf_counter() - start) * 1000)
+
+    def pool_stats(self) -> dict:
+        """커넥션 풀 현황 및 checkout 대기 시간 통계"""
+        return _pool_stats(self)
+
+
+def to_async_url(db_url: str):
+    """postgresql(+psycopg2) URL을 asyncpg 드라이버 URL로 변환"""
+    return make_url(db_url).set(drivername="postgresql+asyncpg")
+
+
+def _pool_stats(connection) -> dict:
+    pool = connection.engine.pool
+    return {
+        "pool_size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeouts": connection.checkout_timeouts,
+        "checkout_wait_ms": connection.checkout_wait.snapshot(),
+    }
+
+
+postgresql_connection = DBConnection(
+    settings.postgresql_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    timezone=settings.db_timezone,
+)
 
-postgresql_connection = DBConnection(settings.postgresql_url)
+postgresql_async_connection = AsyncDBConnection(
+    settings.postgresql_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    timezone=settings.db_timezone,
+)
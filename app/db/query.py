@@ -13,10 +13,43 @@ INSERT_AUDIO_META_DATA = text(
     """
 )
 
+# presigned 업로드 완료 확인용, 같은 file_path는 한 번만 적재 (idx_audio_files_file_path)
+INSERT_UPLOADED_AUDIO_META_DATA = text(
+    """
+    INSERT INTO audio_files (user_id, file_name, file_path, user_mission_ids, created_at) VALUES
+    (
+        :user_id,
+        :file_name,
+        :file_path,
+        :user_mission_ids,
+        current_timestamp
+    )
+    ON CONFLICT (file_path) DO NOTHING
+    """
+)
+
+# 선점한 worker만 상태를 바꾸도록 claimed_by 확인 (lease 만료 후 다른 worker가 가져간 경우 무시)
 UPDATE_AUDIO_STATUS = text(
     """
     UPDATE audio_files
     SET status = :status
+    WHERE id = :audio_files_id AND claimed_by = :worker_id
+    """
+)
+
+UPDATE_AUDIO_COMPLETED = text(
+    """
+    UPDATE audio_files
+    SET status = 'COMPLETED', completed_at = current_timestamp
+    WHERE id = :audio_files_id AND claimed_by = :worker_id
+    RETURNING EXTRACT(EPOCH FROM (completed_at - created_at)) AS time_to_transcript
+    """
+)
+
+UPDATE_STT_SECONDS_SAVED = text(
+    """
+    UPDATE audio_files
+    SET stt_seconds_saved = :stt_seconds_saved
     WHERE id = :audio_files_id
     """
 )
@@ -24,15 +57,102 @@ UPDATE_AUDIO_STATUS = text(
 UPDATE_RECORD_TIME = text(
     """
     UPDATE audio_files
-    SET record_time = :record_time
+    SET record_time = :record_time,
+        sample_rate = :sample_rate,
+        channels = :channels,
+        bit_rate = :bit_rate
     WHERE id = :audio_files_id
     """
 )
 
-SELECT_AUDIO_FILES = text(
+# Clova async 요청 후 결과 대기 상태로 변경 (lease는 더 이상 필요 없음)
+UPDATE_AUDIO_STT_PENDING = text(
     """
-    SELECT * FROM audio_files
-    WHERE audio_files.status = 'READY'
+    UPDATE audio_files
+    SET status = 'STT_PENDING',
+        clova_token = :token,
+        stt_requested_at = current_timestamp,
+        lease_expires_at = NULL
+    WHERE id = :audio_files_id AND claimed_by = :worker_id
+    """
+)
+
+# callback/poll 중 먼저 도착한 쪽만 적재하도록 STT_PENDING인 경우에만 완료 처리
+COMPLETE_PENDING_STT = text(
+    """
+    UPDATE audio_files
+    SET status = 'COMPLETED', completed_at = current_timestamp
+    WHERE clova_token = :token AND status = 'STT_PENDING'
+    RETURNING id, EXTRACT(EPOCH FROM (completed_at - created_at)) AS time_to_transcript
+    """
+)
+
+FAIL_PENDING_STT = text(
+    """
+    UPDATE audio_files
+    SET status = 'STT_ERROR'
+    WHERE clova_token = :token AND status = 'STT_PENDING'
+    RETURNING id
+    """
+)
+
+SELECT_PENDING_STT = text(
+    """
+    SELECT id, clova_token,
+           stt_requested_at < current_timestamp - make_interval(secs => :timeout_seconds) AS expired
+    FROM audio_files
+    WHERE status = 'STT_PENDING'
+      AND stt_requested_at < current_timestamp - make_interval(secs => :grace_seconds)
+    ORDER BY stt_requested_at
+    LIMIT :batch_size
+    """
+)
+
+# 처리 시도 횟수를 다 쓰고 lease가 만료된 파일은 더 선점하지 않고 실패 처리
+FAIL_EXHAUSTED_AUDIO_FILES = text(
+    """
+    UPDATE audio_files
+    SET status = 'PROCESS_ERROR', lease_expires_at = NULL
+    WHERE status = 'PROCESSING'
+      AND lease_expires_at < current_timestamp
+      AND attempts >= :max_attempts
+    RETURNING id
+"""
+)
+
+# READY 또는 lease가 만료된 PROCESSING 파일을 원자적으로 선점
+CLAIM_AUDIO_FILES = text(
+    """
+    UPDATE audio_files
+    SET status = 'PROCESSING',
+        claimed_by = :worker_id,
+        lease_expires_at = current_timestamp + make_interval(secs => :lease_seconds),
+        attempts = attempts + 1
+    WHERE id IN (
+        SELECT id FROM audio_files
+        WHERE status = 'READY'
+           OR (
+               status = 'PROCESSING'
+               AND lease_expires_at < current_timestamp
+               AND attempts < :max_attempts
+           )
+        ORDER BY created_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *
+"""
+)
+
+# 처리 중인 파일의 lease 연장 (heartbeat)
+RENEW_AUDIO_LEASE = text(
+    """
+    UPDATE audio_files
+    SET lease_expires_at = current_timestamp + make_interval(secs => :lease_seconds)
+    WHERE id = :audio_files_id
+      AND claimed_by = :worker_id
+      AND status = 'PROCESSING'
+    RETURNING id
 """
 )
 
@@ -43,6 +163,13 @@ SELECT_AUDIO_FILE = text(
 """
 )
 
+SELECT_AUDIO_FILE_BY_PATH = text(
+    """
+    SELECT id FROM audio_files
+    WHERE file_path = :file_path
+"""
+)
+
 INSERT_IMAGE_FILES_META_DATA = text(
     """
 INSERT INTO image_files (id, speaker, user_id, start_date, end_date, image_path, type) VALUES 
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy.sql.elements import TextClause
+
+from app.config import settings
+from app.db import management_query, query, user_plan_query
+from app.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+QUERY_MODULES = (query, management_query, user_plan_query)
+UNNAMED_QUERY = "UNNAMED"
+
+# text() 상수 객체 id -> 상수 이름 (e.g. SELECT_SPEECH_ACT_COUNT)
+_query_names = {
+    id(value): name
+    for module in QUERY_MODULES
+    for name, value in vars(module).items()
+    if isinstance(value, TextClause)
+}
+
+
+class QueryStats:
+    def __init__(self):
+        self.latency = Histogram()
+        self.rows = 0
+        self.errors = 0
+
+
+_stats = {}
+_lock = threading.Lock()
+
+
+def query_name(query) -> str:
+    return _query_names.get(id(query), UNNAMED_QUERY)
+
+
+def param_shape(params):
+    """바인딩 파라미터의 값 대신 key와 타입만 반환 (개인정보 노출 방지)"""
+    if params is None:
+        return None
+    if isinstance(params, (list, tuple)):
+        return {
+            "rows": len(params),
+            "row": param_shape(params[0]) if params else None,
+        }
+    return {key: type(value).__name__ for key, value in params.items()}
+
+
+def record_query(query, params, elapsed_ms: float, rowcount: int, error: bool):
+    name = query_name(query)
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = QueryStats()
+        stats.rows += max(rowcount, 0)
+        if error:
+            stats.errors += 1
+    stats.latency.observe(elapsed_ms)
+
+    if elapsed_ms >= settings.slow_query_ms:
+        logger.warning(
+            f"Slow query {name}: {elapsed_ms:.1f}ms rows={rowcount} "
+            f"params={param_shape(params)}"
+        )
+
+
+@contextmanager
+def observe_query(query, params=None):
+    """
+    쿼리 실행 시간, row 수, 에러 수를 상수 이름별로 기록합니다.
+    yield된 dict의 rowcount에 처리한 row 수를 채워 넣습니다.
+    paused_ms에 누적한 시간(e.g. generator가 row를 넘기고 멈춰 있던 시간)은 제외합니다.
+    """
+    observation = {"rowcount": 0, "paused_ms": 0.0}
+    error = False
+    start = time.perf_counter()
+    try:
+        yield observation
+    except Exception:
+        error = True
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000 - observation["paused_ms"]
+        record_query(query, params, elapsed_ms, observation["rowcount"], error)
+
+
+def query_stats() -> list:
+    """쿼리별 통계 (총 실행 시간이 큰 순)"""
+    with _lock:
+        items = list(_stats.items())
+    snapshots = [
+        {
+            "query": name,
+            "rows": stats.rows,
+            "errors": stats.errors,
+            "latency_ms": stats.latency.snapshot(),
+        }
+        for name, stats in items
+    ]
+    return sorted(snapshots, key=lambda s: s["latency_ms"]["sum_ms"], reverse=True)
+
+
+def reset_query_stats():
+    with _lock:
+        _stats.clear()
@@ -1,10 +1,8 @@
-from sqlalchemy import text
+import time
+from contextlib import contextmanager
 
-from app.db.connection import postgresql_connection
-
-
-def set_timezone(db, timezone: str = "Asia/Seoul"):
-    db.execute(text(f"SET TIME ZONE '{timezone}'"))
+from app.db.connection import postgresql_async_connection, postgresql_connection
+from app.db.query_metrics import observe_query
 
 
 def execute_select_query(query: str, params: dict = None) -> list:
@@ -20,9 +18,42 @@ def execute_select_query(query: str, params: dict = None) -> list:
     :rtype: list
     """
     with postgresql_connection.get_db() as db:
-        set_timezone(db)
-        result = db.execute(query, params)
-        return [record for record in result.mappings()]
+        with observe_query(query, params) as observation:
+            result = db.execute(query, params)
+            records = [record for record in result.mappings()]
+            observation["rowcount"] = len(records)
+        return records
+
+
+def stream_select_query(query: str, params: dict = None, fetch_size: int = 1000):
+    """
+    SELECT 쿼리를 서버사이드(named) 커서로 실행하고 row를 하나씩 반환하는 generator.
+    fetch_size 만큼씩만 가져오므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    :param query: 실행할 쿼리.
+    :type query: str 또는 TextClause
+
+    :param params: 쿼리 파라미터.
+    :type params: dict
+
+    :param fetch_size: 한 번에 가져올 row 수.
+    :type fetch_size: int
+
+    :return: 쿼리 결과 row.
+    :rtype: Iterator[RowMapping]
+    """
+    with postgresql_connection.get_db() as db:
+        with observe_query(query, params) as observation:
+            result = db.execute(
+                query, params, execution_options={"yield_per": fetch_size}
+            )
+            for record in result.mappings():
+                observation["rowcount"] += 1
+                # 호출자가 row를 처리하는 시간은 쿼리 시간에서 제외
+                paused = time.perf_counter()
+                try:
+                    yield record
+                finally:
+                    observation["paused_ms"] += (time.perf_counter() - paused) * 1000
 
 
 def execute_insert_update_query(
@@ -41,8 +72,9 @@ def execute_insert_update_query(
     """
     with postgresql_connection.get_db() as db:
         try:
-            set_timezone(db)
-            result = db.execute(query, params)
+            with observe_query(query, params) as observation:
+                result = db.execute(query, params)
+                observation["rowcount"] = result.rowcount
             print(f"Affected rows: {result.rowcount}")
             inserted_id = None
             if return_id:
@@ -57,3 +89,126 @@ def execute_insert_update_query(
                 return inserted_id
             else:
                 return result.rowcount
+
+
+def execute_bulk_insert_query(query: str, params_list: list) -> int:
+    """
+    여러 row를 executemany로 하나의 트랜잭션에서 INSERT 합니다.
+    하나라도 실패하면 전체 롤백 후 예외를 다시 발생시킵니다.
+    :param query: 실행할 쿼리.
+    :type query: str 또는 TextClause
+
+    :param params_list: row별 쿼리 파라미터 목록.
+    :type params_list: list[dict]
+
+    :return: 적재된 row 수.
+    :rtype: int
+    """
+    if not params_list:
+        return 0
+    with postgresql_connection.get_db() as db:
+        try:
+            with observe_query(query, params_list) as observation:
+                db.execute(query, params_list)
+                observation["rowcount"] = len(params_list)
+        except Exception as e:
+            db.rollback()
+            print(f"Exception occurred: {e}")
+            raise
+        else:
+            db.commit()
+            print(f"Inserted rows: {len(params_list)}")
+            return len(params_list)
+
+
+class ObservedSession:
+    """execute 호출마다 쿼리 통계를 기록하는 Session 래퍼"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def execute(self, query, params=None, **kwargs):
+        with observe_query(query, params) as observation:
+            result = self.db.execute(query, params, **kwargs)
+            observation["rowcount"] = result.rowcount
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+
+@contextmanager
+def transaction():
+    """
+    여러 쿼리를 하나의 커넥션에서 실행하고 마지막에 한 번만 commit 합니다.
+    블록 안에서 예외가 발생하면 전체 rollback 후 예외를 다시 발생시킵니다.
+
+    with transaction() as db:
+        db.execute(UPDATE_TEXT_EDITED, params)
+        db.execute(UPDATE_AUDIO_FILES_IS_EDIT, params)
+    """
+    with postgresql_connection.get_db() as db:
+        try:
+            yield ObservedSession(db)
+        except Exception as e:
+            db.rollback()
+            print(f"Exception occurred: {e}")
+            raise
+        else:
+            db.commit()
+
+
+async def execute_select_query_async(query: str, params: dict = None) -> list:
+    """
+    SELECT 쿼리를 AsyncEngine으로 실행합니다. (execute_select_query의 async 버전)
+    :param query: 실행할 쿼리.
+    :type query: str 또는 TextClause
+
+    :param params: 쿼리 파라미터.
+    :type params: dict
+
+    :return: 쿼리 결과.
+    :rtype: list
+    """
+    async with postgresql_async_connection.get_db() as db:
+        with observe_query(query, params) as observation:
+            result = await db.execute(query, params)
+            records = [record for record in result.mappings()]
+            observation["rowcount"] = len(records)
+        return records
+
+
+async def execute_write_async(
+    query: str, params: dict = None, return_id: bool = False
+) -> None:
+    """
+    INSERT 또는 UPDATE 쿼리를 AsyncEngine으로 실행합니다.
+    (execute_insert_update_query의 async 버전)
+    :param query: 실행할 쿼리.
+    :type query: str 또는 TextClause
+
+    :param params: 쿼리 파라미터.
+    :type params: dict
+
+    :param return_id: True이면 삽입된 ID를 반환합니다.
+    :type return_id: bool
+    """
+    async with postgresql_async_connection.get_db() as db:
+        try:
+            with observe_query(query, params) as observation:
+                result = await db.execute(query, params)
+                observation["rowcount"] = result.rowcount
+            print(f"Affected rows: {result.rowcount}")
+            inserted_id = None
+            if return_id:
+                inserted_id = result.fetchone()[0]
+        except Exception as e:
+            await db.rollback()
+            print(f"Exception occurred: {e}")
+            return 0
+        else:
+            await db.commit()
+            if return_id:
+                return inserted_id
+            else:
+                return result.rowcount
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -7,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers import (
     audio,
+    internal,
     management,
     plan,
     report_files,
@@ -15,8 +17,14 @@ from app.routers import (
     users,
     user_plans,
 )
-from app.services.audio import download_and_process_file
+from app.config import settings
+from app.services.audio import (
+    download_and_process_file,
+    poll_pending_stt_results,
+    run_audio_worker,
+)
 from app.services.api_key import get_api_key
+from app.services.clova import ClovaApiClient
 
 # 로깅 설정
 log_formatter = logging.Formatter(
@@ -43,10 +51,30 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 업로드 알림 기반 처리, interval poll은 누락 건을 위한 안전망
+    audio_worker = asyncio.create_task(run_audio_worker())
     scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
-    scheduler.add_job(func=download_and_process_file, trigger="interval", minutes=10)
+    scheduler.add_job(
+        func=download_and_process_file,
+        trigger="interval",
+        minutes=settings.audio_poll_interval_minutes,
+        max_instances=1,
+        coalesce=True,
+    )
+    if settings.clova_async_completion:
+        # callback 누락 대비 결과 조회
+        scheduler.add_job(
+            func=poll_pending_stt_results,
+            trigger="interval",
+            minutes=settings.clova_result_poll_minutes,
+            max_instances=1,
+            coalesce=True,
+        )
     scheduler.start()
     yield
+    scheduler.shutdown(wait=False)
+    audio_worker.cancel()
+    await ClovaApiClient.aclose()
 
 
 # FastAPI 앱 생성
@@ -56,13 +84,15 @@ app = FastAPI(lifespan=lifespan)
 # HTTP 요청/응답 로깅 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    # 요청 시작 시 로그 기록
-    logger.info(f"Request: {request.method} {request.url}")
+    # 요청 시작 시 로그 기록 (query string에 secret이 있을 수 있으므로 path만 기록)
+    logger.info(f"Request: {request.method} {request.url.path}")
 
     response = await call_next(request)
 
     # 응답 후 로그 기록
-    logger.info(f"Response: {request.method} {request.url} - {response.status_code}")
+    logger.info(
+        f"Response: {request.method} {request.url.path} - {response.status_code}"
+    )
 
     return response
 
@@ -91,6 +121,7 @@ app.include_router(plan.router)
 app.include_router(management.router)
 app.include_router(user_reports.router)
 app.include_router(user_plans.router)
+app.include_router(internal.router, dependencies=[Depends(get_api_key)])
 
 # API 키 의존성 적용 예 (현재는 주석 처리됨)
 # app.include_router(audio.router, prefix="/audio", dependencies=[Depends(get_api_key)])
@@ -0,0 +1,43 @@
+import threading
+from bisect import bisect_left
+
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """프로세스 내 latency 히스토그램 (ms 단위)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def observe(self, value_ms: float):
+        index = bisect_left(self.buckets, value_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value_ms
+            if value_ms > self.max:
+                self.max = value_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets = {
+                f"le_{bound}": count for bound, count in zip(self.buckets, self.counts)
+            }
+            buckets["le_inf"] = self.counts[-1]
+            return {
+                "count": self.count,
+                "sum_ms": round(self.total, 3),
+                "avg_ms": round(self.total / self.count, 3) if self.count else 0.0,
+                "max_ms": round(self.max, 3),
+                "buckets": buckets,
+            }
@@ -1,15 +1,35 @@
-from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+import asyncio
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    UploadFile,
+)
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
+from app.config import PlaybackMode, settings
 from app.services.audio import (
+    PEAKS_CACHE_CONTROL,
+    audio_file_exists,
     create_audio_metadata,
     create_file_name,
     create_file_path,
+    create_presigned_upload,
+    get_audio_playback,
     get_files_by_user_id,
     insert_audio_metadata,
-    select_audio_file,
+    insert_uploaded_audio_metadata,
+    is_user_upload_path,
+    notify_audio_ready,
+    s3_object_exists,
     select_audio_info,
+    select_audio_peaks,
     upload_to_s3,
 )
 from app.services.users import get_current_user
@@ -25,20 +45,67 @@ async def create_upload_file(
 ):
     try:
         user_id = current_user.get("sub")
-        file_path, m4a_path = create_file_path(user_id)
+        file_path, _ = create_file_path(user_id)
         user_name = current_user.get("user_metadata")["full_name"]
         file_name = create_file_name(user_name)
+        # READY row는 바로 선점될 수 있으므로 S3 적재가 끝난 뒤에 적재
+        await upload_to_s3(audio, file_path[2:])
         metadata = create_audio_metadata(
-            user_id, file_name, m4a_path[2:], user_missions_id
+            user_id, file_name, file_path[2:], user_missions_id
         )
-        insert_audio_metadata(metadata)
-        await upload_to_s3(audio, file_path[2:])
+        if not await asyncio.to_thread(insert_audio_metadata, metadata):
+            raise Exception("Failed to insert audio metadata")
+        notify_audio_ready()
 
         return {"message": "success"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/upload-url", tags=["Audio"])
+async def create_upload_url(current_user: dict = Depends(get_current_user)):
+    """
+    S3 직접 업로드용 presigned POST 발급
+    클라이언트는 url/fields로 업로드 후 /audio/upload-complete 호출
+    """
+    user_id = current_user.get("sub")
+    file_path, _ = create_file_path(user_id)
+    presigned = await asyncio.to_thread(create_presigned_upload, file_path[2:])
+    return {
+        "file_path": file_path[2:],
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+    }
+
+
+class UploadCompleteModel(BaseModel):
+    file_path: str
+    user_missions_id: str = None
+
+
+@router.post("/upload-complete", tags=["Audio"])
+async def complete_upload(
+    upload: UploadCompleteModel, current_user: dict = Depends(get_current_user)
+):
+    """직접 업로드 완료 확인 후 메타데이터 적재 및 처리 시작"""
+    user_id = current_user.get("sub")
+    if not is_user_upload_path(upload.file_path, user_id):
+        raise HTTPException(status_code=400, detail="Invalid file path")
+    if not await asyncio.to_thread(s3_object_exists, upload.file_path):
+        raise HTTPException(status_code=404, detail="Uploaded file not found")
+    user_name = current_user.get("user_metadata")["full_name"]
+    file_name = create_file_name(user_name)
+    metadata = create_audio_metadata(
+        user_id, file_name, upload.file_path, upload.user_missions_id
+    )
+    # 재시도로 중복 호출되어도 ON CONFLICT로 한 번만 적재
+    if await asyncio.to_thread(insert_uploaded_audio_metadata, metadata):
+        notify_audio_ready()
+    elif not await asyncio.to_thread(audio_file_exists, upload.file_path):
+        raise HTTPException(status_code=500, detail="Failed to insert audio metadata")
+    return {"message": "success"}
+
+
 class FileModel(BaseModel):
     user_id: str
 
@@ -55,10 +122,28 @@ async def get_files(user_id: str):
 
 
 @router.get("/webm/{id}", tags=["Audio"])
-async def get_audio_file(id: str, range: str = Header(None)):
-    """file_id 별 audio_files 가져오는 앤드포인트"""
-    audio_url = await select_audio_file(id, range)
-    return audio_url
+async def get_audio_file(
+    id: str,
+    range: str = Header(None),
+    mode: Optional[PlaybackMode] = Query(
+        None,
+        description="proxy | redirect | url (기본값: AUDIO_PLAYBACK_MODE)",
+    ),
+):
+    """
+    file_id 별 audio_files 가져오는 앤드포인트
+    redirect/url 모드는 presigned GET URL을 주어 브라우저가 S3에서 직접 재생
+    """
+    try:
+        response = await get_audio_playback(
+            id, range, mode or settings.audio_playback_mode
+        )
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to load audio file")
+    # None은 audio_files row가 없는 경우뿐
+    if response is None:
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return response
 
 
 @router.get("/webm/info/{id}", tags=["Audio"])
@@ -66,3 +151,20 @@ async def get_audio_info(id: str):
     """file_id 별 audio_files 정보 가져오는 앤드포인트"""
     record_time = await select_audio_info(id)
     return JSONResponse(content={"record_time": record_time})
+
+
+@router.get("/peaks/{id}", tags=["Audio"])
+async def get_audio_peaks(id: str):
+    """
+    file_id 별 파형 peaks 파일 가져오는 앤드포인트
+    header("<4sHIH" magic, version, sample_rate, level 수) 뒤에 level별
+    ("<II" samples_per_bucket, bucket 수) + int8 [min, max] 쌍
+    """
+    peaks = await select_audio_peaks(id)
+    if peaks is None:
+        raise HTTPException(status_code=404, detail="Peaks not found")
+    return Response(
+        content=peaks,
+        media_type="application/octet-stream",
+        headers={"Cache-Control": PEAKS_CACHE_CONTROL},
+    )
@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+
+from app.services.internal import (
+    clear_db_query_stats,
+    get_audio_cache_stats,
+    get_audio_pipeline_stats,
+    get_audio_playback_stats,
+    get_clova_stats,
+    get_db_pool_stats,
+    get_db_query_stats,
+)
+
+router = APIRouter()
+
+
+@router.get("/internal/db/pool", tags=["Internal"])
+async def get_pool_stats():
+    """DB 커넥션 풀 통계를 가져오는 엔드포인트"""
+    return get_db_pool_stats()
+
+
+@router.get("/internal/db/queries", tags=["Internal"])
+async def get_query_stats():
+    """쿼리 상수별 latency 히스토그램을 가져오는 엔드포인트"""
+    return get_db_query_stats()
+
+
+@router.delete("/internal/db/queries", tags=["Internal"])
+async def delete_query_stats():
+    """쿼리 통계 초기화"""
+    clear_db_query_stats()
+    return {"message": "success"}
+
+
+@router.get("/internal/audio/pipeline", tags=["Internal"])
+async def get_pipeline_stats():
+    """오디오 처리 파이프라인 통계를 가져오는 엔드포인트"""
+    return get_audio_pipeline_stats()
+
+
+@router.get("/internal/clova", tags=["Internal"])
+async def get_clova_call_stats():
+    """Clova 호출 통계를 가져오는 엔드포인트"""
+    return get_clova_stats()
+
+
+@router.get("/internal/audio/cache", tags=["Internal"])
+async def get_audio_cache():
+    """재생용 오디오 캐시 통계를 가져오는 엔드포인트"""
+    return get_audio_cache_stats()
+
+
+@router.get("/internal/audio/playback", tags=["Internal"])
+async def get_audio_playback():
+    """오디오 재생 모드별(proxy/redirect/url) latency를 가져오는 엔드포인트"""
+    return get_audio_playback_stats()
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from pydantic import BaseModel
 
 from app.services.management import (
+    decode_report_cursor,
     get_audio_info,
+    get_reports_with_keyset,
     get_reports_with_pagination,
     select_reports_audio_files,
     update_audio_file_is_used,
@@ -16,15 +18,35 @@ router = APIRouter()
 
 @router.get("/management/reports/list", tags=["Management"])
 async def get_user_reports(
-    page: int = Query(..., ge=1),
+    page: int = Query(1, ge=1),
     page_size: int = Query(..., ge=1, le=100),
     inspection: Optional[str] = Query(None, description="Inspection filter"),
     status: Optional[str] = Query(None, description="Status filter"),
     plan_name: Optional[str] = Query(None, description="plan filter"),
+    pagination: str = Query(
+        "offset", pattern="^(offset|keyset)$", description="offset | keyset"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="keyset 모드에서 이전 응답의 next_cursor"
+    ),
 ):
     """
     user_reports 데이터를 가져오는 엔드포인트
+    pagination=keyset 이면 page 대신 cursor(send_at, id 기준)로 페이지를 이동
     """
+    if pagination == "keyset":
+        try:
+            after = decode_report_cursor(cursor) if cursor else None
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        return await get_reports_with_keyset(
+            page_size=page_size,
+            after=after,
+            inspection_filter=inspection,
+            status_filter=status,
+            plan_name_filter=plan_name,
+        )
+
     # Pagination 함수에 필터 전달
     result = await get_reports_with_pagination(
         page=page,
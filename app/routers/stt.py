@@ -1,8 +1,12 @@
+import asyncio
+import hmac
 from typing import List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Request
 from pydantic import BaseModel
 
+from app.config import settings
+from app.services.audio import ingest_stt_result
 from app.services.stt import (
     add_row_stt_data,
     delete_row_stt_data,
@@ -28,12 +32,34 @@ router = APIRouter()
 @router.get("/data/{audio_files_id}", tags=["STT"], response_model=list[dict])
 async def get_data(audio_files_id: str):
     """audio_files_id별로 stt result를 가져오는 엔드포인트"""
-    results = select_stt_data_by_audio_files_id(audio_files_id)
+    results = await select_stt_data_by_audio_files_id(audio_files_id)
     if not results:
         raise HTTPException(status_code=404, detail="STT result not found")
     return results
 
 
+@router.post("/clova/callback", tags=["STT"])
+async def clova_callback(
+    request: Request,
+    key: str = "",
+    x_callback_key: str = Header(default=""),
+):
+    """
+    Clova completion="async" 결과를 받아 적재하는 callback 엔드포인트
+    secret은 X-Callback-Key 헤더로 확인 (헤더를 붙일 수 없는 Clova 직접 호출만 ?key= 사용)
+    """
+    callback_key = x_callback_key or key
+    if not settings.clova_callback_secret or not hmac.compare_digest(
+        callback_key, settings.clova_callback_secret
+    ):
+        raise HTTPException(status_code=403, detail="Invalid callback key")
+    result = await request.json()
+    if not result.get("token"):
+        raise HTTPException(status_code=400, detail="Missing token")
+    ingested = await asyncio.to_thread(ingest_stt_result, result)
+    return {"message": "STT result ingested" if ingested else "Already processed"}
+
+
 class EditTextModel(BaseModel):
     id: str
     audio_files_id: str
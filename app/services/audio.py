@@ -1,33 +1,70 @@
-import io
+import asyncio
 import json
 import logging
 import os
 import re
 import shutil
+import socket
 import subprocess
+import tempfile
+import time
 from datetime import datetime
-from io import BytesIO
+from typing import get_args
+from urllib.parse import urlencode, urlparse
 
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from fastapi import UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 from loguru import logger
-from pydub import AudioSegment
 
-from app.config import settings
+from app.config import PlaybackMode, settings
 from app.db.query import (
+    CLAIM_AUDIO_FILES,
+    COMPLETE_PENDING_STT,
+    FAIL_EXHAUSTED_AUDIO_FILES,
+    FAIL_PENDING_STT,
     INSERT_AUDIO_META_DATA,
     INSERT_STT_DATA,
+    INSERT_UPLOADED_AUDIO_META_DATA,
+    RENEW_AUDIO_LEASE,
     SELECT_AUDIO_FILE,
-    SELECT_AUDIO_FILES,
+    SELECT_AUDIO_FILE_BY_PATH,
     SELECT_FILES,
+    SELECT_PENDING_STT,
+    UPDATE_AUDIO_COMPLETED,
+    UPDATE_AUDIO_FILE_PATH,
     UPDATE_AUDIO_STATUS,
+    UPDATE_AUDIO_STT_PENDING,
     UPDATE_RECORD_TIME,
-    UPDATE_AUDIO_FILE_PATH,
+    UPDATE_STT_SECONDS_SAVED,
+)
+from app.db.worker import (
+    execute_bulk_insert_query,
+    execute_insert_update_query,
+    execute_select_query,
+    transaction,
 )
-from app.db.worker import execute_insert_update_query, execute_select_query
-from app.services.clova import ClovaApiClient
+from app.metrics import Histogram
+from app.services.audio_cache import audio_cache
+from app.services.clova import ClovaApiClient, backoff_seconds
+from app.services.ffmpeg import (
+    MB,
+    audio_content_type,
+    compute_peaks,
+    converted_path,
+    detect_silences,
+    encode_command,
+    encoding_profile,
+    extract_audio_range,
+    probe_audio,
+    run_ffmpeg,
+    s3_transfer_config,
+    transcode_s3_object,
+    trim_audio_regions,
+)
+from app.services.stt_chunks import offset_segments, plan_chunks, relabel_speakers
+from app.services.vad import plan_speech_regions, restore_offsets, trimmed_duration
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +77,12 @@ bucket_name = settings.bucket_name
 
 s3 = session.client("s3")
 
+# peaks는 오디오 경로별로 한 번만 만들어지므로 장기 캐시
+PEAKS_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# 여러 replica/worker가 같은 파일을 처리하지 않도록 선점자 식별
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
 
 def create_file_name(user_name):
     """파일 이름 생성"""
@@ -54,6 +97,46 @@ def create_file_path(user_id):
     return file_path, m4a_path
 
 
+def is_user_upload_path(file_path: str, user_id: str) -> bool:
+    """create_file_path로 만든 해당 유저의 webm 경로인지 확인"""
+    return (
+        re.fullmatch(rf"app/audio/\d{{12}}_{re.escape(user_id)}\.webm", file_path)
+        is not None
+    )
+
+
+def create_presigned_upload(file_path: str) -> dict:
+    """클라이언트가 S3로 직접 올릴 수 있는 presigned POST (url, fields)"""
+    return s3.generate_presigned_post(
+        Bucket=bucket_name,
+        Key=file_path,
+        Fields={"Content-Type": "audio/webm"},
+        Conditions=[
+            {"Content-Type": "audio/webm"},
+            ["content-length-range", 1, settings.audio_upload_max_mb * MB],
+        ],
+        ExpiresIn=settings.s3_presigned_upload_expire_seconds,
+    )
+
+
+def s3_object_exists(file_path: str) -> bool:
+    try:
+        s3.head_object(Bucket=bucket_name, Key=file_path)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise e
+    return True
+
+
+def audio_file_exists(file_path: str) -> bool:
+    return bool(
+        execute_select_query(
+            query=SELECT_AUDIO_FILE_BY_PATH, params={"file_path": file_path}
+        )
+    )
+
+
 def save_audio(file: UploadFile, file_path: str):
     """m4a 파일 저장"""
     with open(file_path, "wb") as buffer:
@@ -67,30 +150,196 @@ def save_audio(file: UploadFile, file_path: str):
 bucket_name = settings.bucket_name
 
 
+# 동시에 처리하는 파일 수 / ffmpeg 동시 실행 수 제한 (CPU 사용량 보호)
+audio_worker_semaphore = asyncio.Semaphore(settings.audio_worker_concurrency)
+ffmpeg_semaphore = asyncio.Semaphore(settings.audio_ffmpeg_concurrency)
+
+# 업로드 완료 알림 (run_audio_worker가 대기)
+audio_ready_event = asyncio.Event()
+
+# 업로드(created_at)부터 STT 완료까지 걸린 시간
+time_to_transcript = Histogram(
+    buckets=(10_000, 30_000, 60_000, 120_000, 300_000, 600_000, 1_800_000, 3_600_000)
+)
+
+# 무음 제거로 STT에 보내지 않은 시간 (파일별)
+vad_saved = Histogram(
+    buckets=(1_000, 10_000, 30_000, 60_000, 300_000, 600_000, 1_800_000)
+)
+
+# /audio/webm/{id} 응답 모드별 처리 시간 (proxy는 응답 헤더 생성까지)
+playback_latency = {mode: Histogram() for mode in get_args(PlaybackMode)}
+
+
+def notify_audio_ready():
+    """업로드 직후 호출하여 파이프라인을 즉시 실행"""
+    audio_ready_event.set()
+
+
+async def run_audio_worker():
+    """업로드 알림을 받을 때마다 파이프라인 실행 (lifespan에서 시작)"""
+    while True:
+        await audio_ready_event.wait()
+        audio_ready_event.clear()
+        try:
+            await download_and_process_file()
+        except Exception as e:
+            logger.error(f"Error in audio worker: {e}")
+
+
 async def download_and_process_file():
-    """S3에서 파일 다운로드 및 처리"""
+    """S3에서 파일 다운로드 및 처리 (파일 단위 병렬 처리)"""
     try:
         logger.info("Starting download_and_process_file task")
-        ready_files = select_audio_ready()
-        for file_record in ready_files:
-            file_path = file_record.file_path
-            local_path = f"./{file_path}"
-            audio_files_id = str(file_record.id)
-            # S3에서 파일 다운로드
-            s3.download_file(settings.bucket_name, file_path, local_path)
-            m4a_path = await convert_file_update_record_time(local_path, audio_files_id)
-            # s3에 적재, 교체
-            s3.upload_file(m4a_path, bucket_name, file_path.replace(".webm", ".m4a"))
-            s3.delete_object(Bucket=settings.bucket_name, Key=file_path)
-            update_audio_file_path(audio_files_id, file_path.replace(".webm", ".m4a"))
-            await process_stt(audio_files_id, m4a_path)
-            await delete_file(m4a_path)
+        while True:
+            ready_files = await asyncio.to_thread(claim_ready_audio_files)
+            if not ready_files:
+                break
+
+            async def run(file_record):
+                async with audio_worker_semaphore:
+                    return await process_audio_file_safely(file_record)
+
+            results = await asyncio.gather(*(run(record) for record in ready_files))
+            logger.info(
+                f"Processed audio batch: {sum(results)}/{len(results)} succeeded"
+            )
+            # 배치가 가득 찼다면 남은 파일이 있을 수 있으므로 계속 선점
+            if len(ready_files) < settings.audio_claim_batch_size:
+                break
         logger.info("Completed download_and_process_file task")
     except Exception as e:
         logger.error(f"Error during file processing: {e}")
         raise e
 
 
+async def process_audio_file_safely(file_record) -> bool:
+    """
+    파일 1건 처리, 실패해도 다른 파일 처리에 영향을 주지 않음
+    lease를 잃으면 다른 worker가 다시 처리하므로 즉시 중단 (중복 STT 요청/적재 방지)
+    """
+    audio_files_id = str(file_record["id"])
+    work = asyncio.create_task(process_audio_file(file_record))
+    heartbeat = asyncio.create_task(keep_audio_lease(audio_files_id, work))
+    try:
+        await work
+    except asyncio.CancelledError:
+        # heartbeat가 끝났다면 lease 상실로 인한 cancel, 아니면 바깥에서 cancel
+        if not heartbeat.done():
+            work.cancel()
+            raise
+        logger.error(f"Stopped processing {audio_files_id}: audio lease lost")
+        return False
+    except Exception as e:
+        logger.error(f"Error during file processing {audio_files_id}: {e}")
+        return False
+    finally:
+        heartbeat.cancel()
+    return True
+
+
+async def process_audio_file(file_record):
+    """S3 다운로드 -> m4a 변환 -> S3 교체 -> STT"""
+    if settings.audio_streaming_transcode:
+        return await process_audio_file_streaming(file_record)
+
+    file_path = file_record["file_path"]
+    local_path = f"./{file_path}"
+    audio_files_id = str(file_record["id"])
+    m4a_file_path = converted_path(file_path)
+    # S3에서 파일 다운로드
+    await asyncio.to_thread(
+        s3.download_file, settings.bucket_name, file_path, local_path
+    )
+    m4a_path = await convert_file_update_record_time(local_path, audio_files_id)
+    await upload_peaks(m4a_path, m4a_file_path)
+    # s3에 적재, 교체
+    await asyncio.to_thread(s3.upload_file, m4a_path, bucket_name, m4a_file_path)
+    await asyncio.to_thread(
+        s3.delete_object, Bucket=settings.bucket_name, Key=file_path
+    )
+    await asyncio.to_thread(update_audio_file_path, audio_files_id, m4a_file_path)
+    await process_stt(audio_files_id, m4a_path)
+    await delete_file(m4a_path)
+
+
+async def process_audio_file_streaming(file_record):
+    """S3 GET -> ffmpeg stdin/stdout -> S3 multipart 업로드 -> URL로 STT"""
+    file_path = file_record["file_path"]
+    audio_files_id = str(file_record["id"])
+    m4a_file_path = converted_path(file_path)
+    try:
+        async with ffmpeg_semaphore:
+            await asyncio.to_thread(
+                transcode_s3_object, s3, bucket_name, file_path, m4a_file_path
+            )
+    except Exception as e:
+        await asyncio.to_thread(update_audio_status, audio_files_id, "CONVERT_ERROR")
+        logger.error(f"Error streaming transcode: {e}")
+        raise e
+    await asyncio.to_thread(
+        s3.delete_object, Bucket=settings.bucket_name, Key=file_path
+    )
+    await asyncio.to_thread(update_audio_file_path, audio_files_id, m4a_file_path)
+    media_url = create_presigned_get_url(m4a_file_path)
+    await update_record_time(media_url, audio_files_id)
+    await upload_peaks(media_url, m4a_file_path)
+    await process_stt(audio_files_id, None, media_url=media_url)
+
+
+def peaks_path(file_path: str) -> str:
+    """오디오와 같은 위치의 peaks 파일 경로"""
+    return os.path.splitext(file_path)[0] + ".peaks"
+
+
+async def upload_peaks(source: str, file_path: str):
+    """
+    파형 peaks 파일을 만들어 오디오 옆에 적재
+    실패해도 STT는 계속 진행할 수 있도록 로그만 남김
+    """
+    try:
+        async with ffmpeg_semaphore:
+            peaks = await compute_peaks(source)
+        await asyncio.to_thread(
+            s3.put_object,
+            Bucket=bucket_name,
+            Key=peaks_path(file_path),
+            Body=peaks,
+            ContentType="application/octet-stream",
+            CacheControl=PEAKS_CACHE_CONTROL,
+        )
+    except Exception as e:
+        logger.error(f"Error creating peaks {file_path}: {e}")
+
+
+async def select_audio_peaks(id):
+    """audio_files_id 별 peaks 파일, 없으면 None"""
+    audio_file = await asyncio.to_thread(
+        execute_select_query, query=SELECT_AUDIO_FILE, params={"id": id}
+    )
+    if not audio_file:
+        return None
+    try:
+        s3_response = await asyncio.to_thread(
+            s3.get_object,
+            Bucket=bucket_name,
+            Key=peaks_path(audio_file[0]["file_path"]),
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return None
+        raise e
+    return await asyncio.to_thread(s3_response["Body"].read)
+
+
+def create_presigned_get_url(file_path: str) -> str:
+    return s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket_name, "Key": file_path},
+        ExpiresIn=settings.s3_presigned_expire_seconds,
+    )
+
+
 def update_audio_file_path(audio_files_id, file_path):
     execute_insert_update_query(
         query=UPDATE_AUDIO_FILE_PATH,
@@ -98,9 +347,65 @@ def update_audio_file_path(audio_files_id, file_path):
     )
 
 
-def select_audio_ready():
-    results = execute_select_query(query=SELECT_AUDIO_FILES)
-    return results
+def claim_ready_audio_files():
+    """
+    처리할 파일을 SKIP LOCKED로 선점하고 PROCESSING 상태로 변경
+    lease가 만료된 PROCESSING 파일(처리 중 죽은 worker)도 다시 가져옴
+    audio_max_attempts번 선점하고도 끝나지 않은 파일은 PROCESS_ERROR 처리
+    """
+    with transaction() as db:
+        exhausted = db.execute(
+            FAIL_EXHAUSTED_AUDIO_FILES,
+            {"max_attempts": settings.audio_max_attempts},
+        ).all()
+        for row in exhausted:
+            logger.error(f"Audio file exceeded max attempts: {row.id}")
+        result = db.execute(
+            CLAIM_AUDIO_FILES,
+            {
+                "worker_id": WORKER_ID,
+                "lease_seconds": settings.audio_claim_lease_seconds,
+                "batch_size": settings.audio_claim_batch_size,
+                "max_attempts": settings.audio_max_attempts,
+            },
+        )
+        return result.mappings().all()
+
+
+def renew_audio_lease(audio_files_id) -> bool:
+    """
+    선점한 파일의 lease 연장, 다른 worker가 가져갔으면 False
+    DB 오류는 lease 상실과 구분하도록 예외로 전달
+    """
+    with transaction() as db:
+        renewed = db.execute(
+            RENEW_AUDIO_LEASE,
+            {
+                "audio_files_id": audio_files_id,
+                "worker_id": WORKER_ID,
+                "lease_seconds": settings.audio_claim_lease_seconds,
+            },
+        ).first()
+    return renewed is not None
+
+
+async def keep_audio_lease(audio_files_id, work: asyncio.Task):
+    """
+    처리가 끝날 때까지 주기적으로 lease 연장 (처리 task와 함께 실행 후 cancel)
+    lease를 잃으면 work를 cancel 하고 반환
+    """
+    while True:
+        await asyncio.sleep(settings.audio_lease_heartbeat_seconds)
+        try:
+            renewed = await asyncio.to_thread(renew_audio_lease, audio_files_id)
+        except Exception as e:
+            # 일시적 DB 오류는 lease가 남아 있는 동안 다음 주기에 재시도
+            logger.warning(f"Error renewing audio lease {audio_files_id}: {e}")
+            continue
+        if not renewed:
+            logger.error(f"Lost audio lease: {audio_files_id}")
+            work.cancel()
+            return
 
 
 async def convert_file_update_record_time(local_path: str, audio_files_id):
@@ -108,33 +413,52 @@ async def convert_file_update_record_time(local_path: str, audio_files_id):
     try:
         with open(local_path, "rb") as f:
             file_bytes = f.read()
-        m4a_path = convert_to_m4a(file_bytes, local_path)
+        async with ffmpeg_semaphore:
+            m4a_path = await convert_to_m4a(file_bytes, local_path)
+        await update_record_time(m4a_path, audio_files_id)
         logger.info(f"Audio file metadata inserted: {m4a_path}")
         return m4a_path
     except Exception as e:
-        update_audio_status(audio_files_id, "CONVERT_ERROR")
+        await asyncio.to_thread(update_audio_status, audio_files_id, "CONVERT_ERROR")
         await delete_file(local_path)
         logger.error(f"Error processing metadata: {e}")
         raise e
 
 
-def insert_record_time(record_time, audio_files_id):
-    """record_time update"""
+def insert_record_time(
+    record_time, audio_files_id, sample_rate=None, channels=None, bit_rate=None
+):
+    """record_time 및 오디오 속성 update"""
     execute_insert_update_query(
         query=UPDATE_RECORD_TIME,
-        params={"record_time": record_time, "audio_files_id": audio_files_id},
+        params={
+            "record_time": record_time,
+            "audio_files_id": audio_files_id,
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "bit_rate": bit_rate,
+        },
     )
 
 
-def get_record_time(m4a_path: str):
-    """M4A 파일의 재생 시간을 가져옴"""
+async def update_record_time(source: str, audio_files_id):
+    """
+    ffprobe로 길이/샘플레이트/채널/비트레이트를 읽어 저장
+    실패해도 STT는 계속 진행할 수 있도록 로그만 남김
+    """
     try:
-        audio = AudioSegment.from_file(m4a_path, format="m4a")
-        duration_seconds = len(audio) / 1000.0
-        return round(duration_seconds)
+        properties = await probe_audio(source)
+        record_time = round(properties["duration"]) if properties["duration"] else None
+        await asyncio.to_thread(
+            insert_record_time,
+            record_time,
+            audio_files_id,
+            properties["sample_rate"],
+            properties["channels"],
+            properties["bit_rate"],
+        )
     except Exception as e:
-        logger.error(f"Error getting record time: {e}")
-        raise Exception("Failed to get record time")
+        logger.error(f"Error getting record time {audio_files_id}: {e}")
 
 
 def create_audio_metadata(
@@ -157,73 +481,345 @@ def insert_audio_metadata(metadata: dict):
     )
 
 
+def insert_uploaded_audio_metadata(metadata: dict) -> int:
+    """직접 업로드 파일 메타데이터 적재, 이미 적재된 file_path면 0 반환"""
+    return execute_insert_update_query(
+        query=INSERT_UPLOADED_AUDIO_META_DATA,
+        params=metadata,
+    )
+
+
 def update_audio_status(audio_files_id, status):
     execute_insert_update_query(
         query=UPDATE_AUDIO_STATUS,
-        params={"audio_files_id": audio_files_id, "status": status},
+        params={
+            "audio_files_id": audio_files_id,
+            "status": status,
+            "worker_id": WORKER_ID,
+        },
     )
 
 
-async def process_stt(audio_files_id, m4a_path):
-    """음성파일 STT"""
+def complete_audio_file(segments, audio_files_id) -> bool:
+    """
+    COMPLETED 처리와 세그먼츠 적재를 한 트랜잭션으로 실행 및 time-to-transcript 기록
+    lease를 잃어 다른 worker가 선점한 파일이면 적재하지 않고 False 반환
+    """
+    with transaction() as db:
+        completed = db.execute(
+            UPDATE_AUDIO_COMPLETED,
+            {"audio_files_id": audio_files_id, "worker_id": WORKER_ID},
+        ).first()
+        if completed is None:
+            return False
+        db.execute(INSERT_STT_DATA, build_stt_rows(segments, audio_files_id))
+    if completed.time_to_transcript:
+        elapsed_seconds = float(completed.time_to_transcript)
+        time_to_transcript.observe(elapsed_seconds * 1000)
+        logger.info(f"Time to transcript {audio_files_id}: {elapsed_seconds:.1f}s")
+    return True
+
+
+async def process_stt(audio_files_id, m4a_path, media_url=None):
+    """음성파일 STT (media_url이 있으면 로컬 파일 대신 URL로 요청)"""
+    if settings.clova_async_completion:
+        return await submit_stt(audio_files_id, m4a_path, media_url)
+    trimmed = None
     try:
-        segments = get_stt_results(m4a_path)
-        if not segments:
+        if settings.stt_vad_enabled:
+            trimmed = await trim_silence(media_url or m4a_path, audio_files_id)
+        if trimmed:
+            trimmed_path, offset_map = trimmed
+            rename_segments = await get_renamed_stt_segments(trimmed_path)
+            rename_segments = restore_offsets(rename_segments, offset_map)
+        else:
+            rename_segments = await get_renamed_stt_segments(m4a_path, media_url)
+        if not rename_segments:
             logger.error(f"No segments found for file: {audio_files_id}")
-            update_audio_status(audio_files_id, "STT_ERROR")
-            delete_file(m4a_path)
+            await asyncio.to_thread(update_audio_status, audio_files_id, "STT_ERROR")
+            await delete_file(m4a_path)
             return
 
-        rename_segments = rename_keys(segments)
         # explode_segments = explode(rename_segments, "textEdited")
-        insert_stt_segments(rename_segments, audio_files_id)
-        update_audio_status(audio_files_id, "COMPLETED")
+        completed = await asyncio.to_thread(
+            complete_audio_file, rename_segments, audio_files_id
+        )
     except Exception as e:
-        update_audio_status(audio_files_id, "STT_ERROR")
-        delete_file(m4a_path)
+        await asyncio.to_thread(update_audio_status, audio_files_id, "STT_ERROR")
+        await delete_file(m4a_path)
         raise e
     else:
-        logger.info(f"STT segments inserted: {audio_files_id}")
+        if completed:
+            logger.info(f"STT segments inserted: {audio_files_id}")
+        else:
+            logger.warning(f"STT segments discarded (lease lost): {audio_files_id}")
+    finally:
+        if trimmed:
+            await delete_file(trimmed[0])
 
 
-async def upload_to_s3(audio: UploadFile, file_path):
-    """m4a 파일을 S3에 저장"""
+async def get_renamed_stt_segments(m4a_path, media_url=None):
+    """설정에 따라 chunk 병렬 또는 한 번에 STT 후 rename_keys를 거친 세그먼츠 반환"""
+    if settings.stt_chunking_enabled:
+        return await get_chunked_stt_results(m4a_path, media_url)
+    segments = await request_stt_segments(m4a_path, media_url)
+    return rename_keys(segments) if segments else []
+
+
+async def trim_silence(source: str, audio_files_id):
+    """
+    긴 무음 구간을 잘라낸 STT용 임시 파일 생성, 줄어든 시간은 stt_seconds_saved에 기록
+    :return: (trimmed_path, offset_map), 잘라낼 구간이 없거나 실패하면 None
+    """
+    trimmed_path = None
+    try:
+        duration = (await probe_audio(source))["duration"]
+        if not duration:
+            return None
+        async with ffmpeg_semaphore:
+            silences = await detect_silences(
+                source,
+                duration,
+                settings.stt_vad_noise_db,
+                settings.stt_vad_min_silence_seconds,
+            )
+        regions, offset_map = plan_speech_regions(
+            duration, silences, settings.stt_vad_keep_seconds
+        )
+        seconds_saved = duration - trimmed_duration(regions)
+        if not regions or seconds_saved < settings.stt_vad_min_silence_seconds:
+            return None
+        # streaming 모드에는 로컬 작업 디렉토리가 없으므로 임시 파일 사용
+        fd, trimmed_path = tempfile.mkstemp(
+            prefix=f"{audio_files_id}_vad_", suffix=encoding_profile()["extension"]
+        )
+        os.close(fd)
+        async with ffmpeg_semaphore:
+            await trim_audio_regions(source, regions, trimmed_path)
+        vad_saved.observe(seconds_saved * 1000)
+        await asyncio.to_thread(
+            execute_insert_update_query,
+            UPDATE_STT_SECONDS_SAVED,
+            {
+                "audio_files_id": audio_files_id,
+                "stt_seconds_saved": round(seconds_saved, 1),
+            },
+        )
+    except asyncio.CancelledError:
+        await delete_file(trimmed_path)
+        raise
+    except Exception as e:
+        # 무음 제거 실패 시 원본으로 STT
+        logger.error(f"Error trimming silence {audio_files_id}: {e}")
+        await delete_file(trimmed_path)
+        return None
+
+    logger.info(
+        f"Silence trimmed {audio_files_id}: {seconds_saved:.1f}s of {duration:.1f}s"
+    )
+    return trimmed_path, offset_map
+
+
+async def request_stt_segments(m4a_path, media_url=None):
+    """파일 전체를 한 번에 STT 요청"""
+    if media_url:
+        return await get_stt_results_from_url(media_url)
+    return await get_stt_results_async(m4a_path)
+
+
+async def get_chunked_stt_results(m4a_path, media_url=None):
+    """
+    긴 녹음은 무음 구간에서 나눠 chunk별로 동시에 STT 후 시간/화자를 맞춰 합침
+    stt_chunk_min_seconds 이하인 녹음은 한 번에 요청
+    :return: rename_keys를 거친 세그먼츠
+    """
+    source = media_url or m4a_path
+    duration = (await probe_audio(source))["duration"]
+    if not duration or duration <= settings.stt_chunk_min_seconds:
+        segments = await request_stt_segments(m4a_path, media_url)
+        return rename_keys(segments) if segments else []
+
+    silences = await detect_silences(
+        source,
+        duration,
+        settings.stt_silence_noise_db,
+        settings.stt_silence_min_seconds,
+    )
+    chunks = plan_chunks(duration, silences, settings.stt_chunk_target_seconds)
+    semaphore = asyncio.Semaphore(settings.stt_chunk_concurrency)
+    with tempfile.TemporaryDirectory() as chunk_dir:
+        # 하나라도 재시도 후 실패하면 나머지 chunk 요청도 취소
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    recognize_chunk(source, index, start, end, chunk_dir, semaphore)
+                )
+                for index, (start, end) in enumerate(chunks)
+            ]
+    logger.info(f"Chunked STT: {len(chunks)} chunks for {duration:.0f}s")
+    return [segment for task in tasks for segment in task.result()]
+
+
+async def recognize_chunk(source, index, start, end, chunk_dir, semaphore):
+    """chunk 1개 STT, 실패하면 해당 chunk만 재시도"""
+    # 재인코딩 없이 자르므로 원본과 같은 컨테이너 사용
+    extension = os.path.splitext(urlparse(source).path)[1] or ".m4a"
+    chunk_path = os.path.join(chunk_dir, f"chunk_{index}{extension}")
+    extracted = False
+    async with semaphore:
+        for attempt in range(settings.stt_chunk_max_retries + 1):
+            try:
+                if not extracted:
+                    async with ffmpeg_semaphore:
+                        await extract_audio_range(source, start, end, chunk_path)
+                    extracted = True
+                segments = await get_stt_results_async(chunk_path)
+                break
+            except Exception as e:
+                if attempt == settings.stt_chunk_max_retries:
+                    raise e
+                logger.warning(f"STT chunk {index} failed, retrying: {e}")
+                await asyncio.sleep(backoff_seconds(attempt))
+    if not segments:
+        return []
+    return relabel_speakers(offset_segments(rename_keys(segments), round(start * 1000)))
+
+
+def clova_callback_url():
+    query = urlencode({"key": settings.clova_callback_secret})
+    return f"{settings.clova_callback_url}?{query}"
+
+
+async def submit_stt(audio_files_id, m4a_path, media_url=None):
+    """
+    completion="async"로 STT 요청 후 token만 저장하고 바로 반환
+    결과는 /stt/clova/callback 또는 poll_pending_stt_results에서 적재
+    """
+    clova_api_client = ClovaApiClient()
+    options = {
+        "completion": "async",
+        "callback": clova_callback_url(),
+        "userdata": {"audio_files_id": audio_files_id},
+    }
     try:
-        audio_content = await audio.read()
-        audio_stream = BytesIO(audio_content)
+        if media_url:
+            response = await clova_api_client.arequest_stt_url(url=media_url, **options)
+        else:
+            response = await clova_api_client.arequest_stt(
+                file_path=m4a_path, **options
+            )
+        token = json.loads(response.text)["token"]
+        await asyncio.to_thread(
+            execute_insert_update_query,
+            UPDATE_AUDIO_STT_PENDING,
+            {
+                "audio_files_id": audio_files_id,
+                "token": token,
+                "worker_id": WORKER_ID,
+            },
+        )
+    except Exception as e:
+        await asyncio.to_thread(update_audio_status, audio_files_id, "STT_ERROR")
+        await delete_file(m4a_path)
+        raise e
+    else:
+        logger.info(f"STT requested: {audio_files_id} (token {token})")
 
-        # S3에 업로드
-        s3.upload_fileobj(audio_stream, settings.bucket_name, file_path)
+
+def ingest_stt_result(result: dict) -> bool:
+    """
+    Clova async 결과 적재, callback과 poll이 동시에 와도 한 번만 적재됨
+    :return: 이번 호출에서 적재(또는 실패 처리)했으면 True
+    """
+    token = result.get("token")
+    segments = result.get("segments")
+    if result.get("result") != "COMPLETED" or not segments:
+        with transaction() as db:
+            failed = db.execute(FAIL_PENDING_STT, {"token": token}).first()
+        if failed:
+            logger.error(f"STT failed: {failed.id} ({result.get('message')})")
+        return failed is not None
+
+    rename_segments = rename_keys(segments)
+    with transaction() as db:
+        # 행 잠금으로 동시 적재를 직렬화, 이미 처리된 token이면 건너뜀
+        completed = db.execute(COMPLETE_PENDING_STT, {"token": token}).first()
+        if completed is None:
+            return False
+        db.execute(
+            INSERT_STT_DATA,
+            build_stt_rows(rename_segments, str(completed.id)),
+        )
+    if completed.time_to_transcript:
+        time_to_transcript.observe(float(completed.time_to_transcript) * 1000)
+    logger.info(f"STT segments inserted: {completed.id}")
+    return True
+
+
+async def poll_pending_stt_results():
+    """callback을 받지 못한 STT_PENDING 파일의 결과를 직접 조회"""
+    pending = await asyncio.to_thread(
+        execute_select_query,
+        SELECT_PENDING_STT,
+        {
+            "grace_seconds": settings.clova_result_poll_grace_seconds,
+            "timeout_seconds": settings.clova_result_timeout_seconds,
+            "batch_size": settings.audio_claim_batch_size,
+        },
+    )
+    clova_api_client = ClovaApiClient()
+    for record in pending:
+        token = record["clova_token"]
+        try:
+            response = await clova_api_client.aget_result(token)
+            result = json.loads(response.text)
+            if result.get("result") in ("COMPLETED", "FAILED"):
+                await asyncio.to_thread(ingest_stt_result, {**result, "token": token})
+            elif record["expired"]:
+                await asyncio.to_thread(
+                    ingest_stt_result,
+                    {"token": token, "result": "FAILED", "message": "timed out"},
+                )
+        except Exception as e:
+            logger.error(f"Error polling STT result {record['id']}: {e}")
+
+
+async def upload_to_s3(audio: UploadFile, file_path):
+    """
+    업로드 파일을 S3 multipart로 스트리밍 적재 (실패 시 예외 발생)
+    UploadFile은 디스크에 spool 되어 있으므로 part 크기 x 동시성 만큼만 메모리 사용
+    """
+    try:
+        await audio.seek(0)
+        await asyncio.to_thread(
+            s3.upload_fileobj,
+            audio.file,
+            settings.bucket_name,
+            file_path,
+            Config=s3_transfer_config(),
+        )
     except NoCredentialsError:
-        return {"error": "Credentials not available"}
-    except ClientError as e:
-        return {"error": str(e)}
+        logger.error(f"Error uploading to S3 {file_path}: credentials not available")
+        raise Exception("Credentials not available")
     except Exception as e:
-        return {"error": str(e)}
+        logger.error(f"Error uploading to S3 {file_path}: {e}")
+        raise e
     else:
         logger.info(f"File uploaded to S3: {file_path}")
         return {"message": "File uploaded successfully"}
 
 
-def convert_to_m4a(file_bytes: bytes, input_path: str):
-    """WebM 파일을 M4A로 변환"""
-    output_path = input_path.replace(".webm", ".m4a")
+async def convert_to_m4a(file_bytes: bytes, input_path: str):
+    """
+    WebM 파일을 settings.audio_encoding_profile 로 변환 (기본값 AAC 192k m4a)
+    timeout 초과/취소 시 ffmpeg 종료
+    """
+    output_path = converted_path(input_path)
     with open(input_path, "wb") as buffer:
         buffer.write(file_bytes)
 
-    command = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        input_path,
-        "-acodec",
-        "aac",
-        "-b:a",
-        "192k",
-        output_path,
-    ]
     try:
-        subprocess.run(command, check=True)
+        await run_ffmpeg(encode_command(input_path, output_path))
         os.remove(input_path)  # Remove the original webm file after conversion
         return output_path
     except subprocess.CalledProcessError as e:
@@ -237,8 +833,8 @@ def insert_audio_file_metadata(metadata: dict):
 
 
 def insert_stt_data(data_list):
-    """stt 결과값 db 적재"""
-    execute_insert_update_query(query=INSERT_STT_DATA, params=data_list)
+    """stt 결과값 db 일괄 적재 (단일 트랜잭션)"""
+    execute_bulk_insert_query(query=INSERT_STT_DATA, params_list=data_list)
 
 
 def get_stt_results(file_path):
@@ -253,8 +849,33 @@ def get_stt_results(file_path):
     return data["segments"]
 
 
+async def get_stt_results_async(file_path):
+    """클로바에서 나온 stt 세그먼츠 return (async 클라이언트)"""
+    clova_api_client = ClovaApiClient()
+    response = await clova_api_client.arequest_stt(file_path=file_path)
+
+    data = json.loads(response.text)
+    return data["segments"]
+
+
+async def get_stt_results_from_url(media_url):
+    """URL의 미디어로 요청한 클로바 stt 세그먼츠 return"""
+    clova_api_client = ClovaApiClient()
+    response = await clova_api_client.arequest_stt_url(url=media_url)
+
+    data = json.loads(response.text)
+    return data["segments"]
+
+
 def insert_stt_segments(segments, audio_files_id):
     """stt결과값 필요 세그먼츠 추출 밑 적재"""
+    data_list = build_stt_rows(segments, audio_files_id)
+    insert_stt_data(data_list)
+    return data_list
+
+
+def build_stt_rows(segments, audio_files_id):
+    """rename_keys를 거친 세그먼츠를 stt_data row로 변환"""
     data_list = []
     for text_order, segment in enumerate(segments, start=1):
         segment_data = {
@@ -268,7 +889,6 @@ def insert_stt_segments(segments, audio_files_id):
             "text_edited": segment["textEdited"],
         }
         data_list.append(segment_data)
-        insert_stt_data(segment_data)
     return data_list
 
 
@@ -388,6 +1008,8 @@ def rename_keys(segments):
 
 
 async def delete_file(m4a_path):
+    if not m4a_path:
+        return
     try:
         if os.path.exists(m4a_path):
             os.remove(m4a_path)
@@ -416,29 +1038,133 @@ def recordtime_to_min_sec(record_time):
     return {"분": minutes, "초": round(seconds, 3)}
 
 
-async def select_audio_file(id, range_header):
-    audio_file = execute_select_query(query=SELECT_AUDIO_FILE, params={"id": id})
-    file_path = audio_file[0].file_path
-    return await get_audio(file_path, range_header)
+def create_presigned_playback_url(file_path: str) -> str:
+    """브라우저가 S3에 직접 Range 요청할 수 있는 짧은 수명의 GET URL"""
+    return s3.generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": bucket_name,
+            "Key": file_path,
+            "ResponseContentType": audio_content_type(file_path),
+        },
+        ExpiresIn=settings.s3_presigned_playback_expire_seconds,
+    )
 
 
-async def get_audio(file_path: str, range_header: str = None):
+async def get_audio_playback(id, range_header, mode: PlaybackMode):
+    """
+    mode별 재생 응답
+    proxy: API가 오디오 바이트를 중계 / redirect: presigned URL로 307 / url: presigned URL JSON
+    """
+    start = time.perf_counter()
     try:
-        # S3에서 오디오 파일 불러오기
-        s3_response = s3.get_object(Bucket=bucket_name, Key=file_path)
-        audio_content = s3_response["Body"].read()
-        file_name = file_path.split("/")[-1]
-        content_length = len(audio_content)
+        audio_file = await asyncio.to_thread(
+            execute_select_query, query=SELECT_AUDIO_FILE, params={"id": id}
+        )
+        if not audio_file:
+            return None
+        if mode == "proxy":
+            return await get_audio(audio_file[0]["file_path"], range_header)
+        url = create_presigned_playback_url(audio_file[0]["file_path"])
+        if mode == "redirect":
+            return RedirectResponse(url, status_code=307)
+        return {
+            "url": url,
+            "expires_in": settings.s3_presigned_playback_expire_seconds,
+        }
+    finally:
+        playback_latency[mode].observe((time.perf_counter() - start) * 1000)
+
+
+def parse_range(range_header: str):
+    """'bytes=start-end' 형식의 Range 헤더 파싱, 없거나 형식이 다르면 None"""
+    if not range_header:
+        return None
+    match = re.match(r"bytes=(\d+)-(\d*)", range_header)
+    if not match:
+        return None
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else None
+    return start, end
+
+
+def iter_file_range(f, start: int, end: int):
+    """캐시 파일의 start~end 구간을 chunk 단위로 읽음"""
+    chunk_size = settings.audio_stream_chunk_kb * 1024
+    try:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+def iter_s3_body(body):
+    try:
+        yield from body.iter_chunks(settings.audio_stream_chunk_kb * 1024)
+    finally:
+        body.close()
 
-        start, end = 0, content_length - 1
-        if range_header:
-            match = re.match(r"bytes=(\d+)-(\d*)", range_header)
-            if match:
-                start = int(match.group(1))
-                end = int(match.group(2)) if match.group(2) else content_length - 1
 
-        # 오디오 내용을 BytesIO 객체에 쓰기
-        buffer = io.BytesIO(audio_content[start : end + 1])
+def download_audio_to_cache(file_path: str):
+    return lambda path: s3.download_file(bucket_name, file_path, path)
+
+
+async def get_audio(file_path: str, range_header: str = None):
+    """
+    오디오 재생 응답
+    캐시에 있으면 로컬 파일에서, 없으면 S3 ranged GET으로 요청 구간만 스트리밍
+    실패하면 예외를 다시 발생시킴
+    """
+    try:
+        file_name = file_path.split("/")[-1]
+        byte_range = parse_range(range_header)
+
+        cached = audio_cache.open(file_path) if audio_cache else None
+        if cached:
+            f, content_length = cached
+            start, end = byte_range or (0, None)
+            end = content_length - 1 if end is None else min(end, content_length - 1)
+            if start > end:
+                f.close()
+                return Response(
+                    status_code=416,
+                    headers={"Content-Range": f"bytes */{content_length}"},
+                )
+            content = iter_file_range(f, start, end)
+        else:
+            params = {"Bucket": bucket_name, "Key": file_path}
+            if byte_range:
+                start, end = byte_range
+                params["Range"] = f"bytes={start}-{'' if end is None else end}"
+            try:
+                s3_response = await asyncio.to_thread(s3.get_object, **params)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "InvalidRange":
+                    return Response(status_code=416)
+                raise e
+            content_range = s3_response.get("ContentRange")
+            if content_range:
+                # "bytes start-end/total"
+                span, total = content_range.split(" ")[1].split("/")
+                start, end = (int(value) for value in span.split("-"))
+                content_length = int(total)
+            else:
+                content_length = s3_response["ContentLength"]
+                start, end = 0, content_length - 1
+            content = iter_s3_body(s3_response["Body"])
+            if audio_cache and audio_cache.should_fill(file_path, content_length):
+                asyncio.get_running_loop().run_in_executor(
+                    None,
+                    audio_cache.fill,
+                    file_path,
+                    download_audio_to_cache(file_path),
+                )
 
         headers = {
             "Content-Disposition": f"inline; filename={file_name}",
@@ -447,18 +1173,17 @@ async def get_audio(file_path: str, range_header: str = None):
             "Content-Length": str(end - start + 1),
         }
 
-        # BytesIO 객체의 시작 위치를 0으로 되돌립니다.
-        buffer.seek(0)
-
         # 오디오 파일을 StreamingResponse로 반환
         return StreamingResponse(
-            content=buffer,
+            content=content,
             headers=headers,
-            media_type="audio/m4a",
-            status_code=206 if range_header else 200,
+            media_type=audio_content_type(file_path),
+            status_code=206 if byte_range else 200,
         )
     except Exception as e:
+        # S3/자격 증명 오류가 404로 보이지 않도록 호출자에게 전달
         logger.error(f"Error processing audio file: {e}")
+        raise e
 
 
 async def select_audio_info(id: str):
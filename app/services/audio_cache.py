@@ -0,0 +1,134 @@
+import atexit
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+# 캐시가 만드는 파일 이름 (sha1 hex, 다운로드 중에는 .tmp)
+CACHE_FILE_NAME = re.compile(r"^[0-9a-f]{40}(\.tmp)?$")
+
+
+class AudioObjectCache:
+    """
+    재생용 S3 오디오 객체 on-disk LRU 캐시
+    max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 삭제
+    인덱스가 프로세스 메모리에 있으므로 directory 아래 프로세스별 하위 디렉토리를 사용하며,
+    max_bytes도 프로세스별 한도 (uvicorn worker N개면 디스크는 최대 N x max_bytes)
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_object_bytes: int):
+        self.directory = os.path.join(directory, str(os.getpid()))
+        self.max_bytes = max_bytes
+        self.max_object_bytes = max_object_bytes
+        self.entries = OrderedDict()
+        self.pending = set()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # 같은 pid를 쓰던 이전 프로세스가 남긴 캐시 파일은 인덱스가 없으므로 정리
+        os.makedirs(self.directory, exist_ok=True)
+        for name in os.listdir(self.directory):
+            if CACHE_FILE_NAME.match(name):
+                os.remove(os.path.join(self.directory, name))
+        atexit.register(self.close)
+
+    def _local_path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def open(self, key: str):
+        """
+        캐시된 파일을 열어 (file, size) 반환, 없으면 None
+        lock 안에서 열기 때문에 이후 evict 되어도 열린 파일은 계속 읽을 수 있음
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            path, size = entry
+            return open(path, "rb"), size
+
+    def should_fill(self, key: str, size: int) -> bool:
+        return size <= self.max_object_bytes and key not in self.pending
+
+    def fill(self, key: str, download):
+        """download(path)로 객체 전체를 받아 캐시에 추가 (worker thread에서 실행)"""
+        with self._lock:
+            if key in self.entries or key in self.pending:
+                return
+            self.pending.add(key)
+        path = self._local_path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            download(tmp_path)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+            with self._lock:
+                self.entries[key] = (path, size)
+                self.total_bytes += size
+                self._evict()
+        except Exception as e:
+            logger.error(f"Error caching audio {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        finally:
+            with self._lock:
+                self.pending.discard(key)
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self.entries:
+            _, (path, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def close(self):
+        """프로세스 종료 시 자신의 하위 디렉토리 삭제"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "directory": self.directory,
+            }
+
+
+audio_cache = (
+    AudioObjectCache(
+        settings.audio_cache_dir,
+        settings.audio_cache_max_mb * MB,
+        settings.audio_cache_max_object_mb * MB,
+    )
+    if settings.audio_cache_dir
+    else None
+)
+
+
+def audio_cache_stats() -> dict:
+    if audio_cache is None:
+        return {"enabled": False}
+    return audio_cache.snapshot()
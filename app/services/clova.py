@@ -1,17 +1,220 @@
+import asyncio
 import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.config import settings
+from app.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ClovaCallStats:
+    """Clova 엔드포인트별 호출 통계"""
+
+    def __init__(self):
+        self.latency = Histogram(
+            buckets=(100, 500, 1000, 5000, 10_000, 30_000, 60_000, 300_000, 900_000)
+        )
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+
+    def record(self, elapsed_ms: float, size: int, error: bool):
+        self.latency.observe(elapsed_ms)
+        with self._lock:
+            self.calls += 1
+            self.bytes_sent += size
+            if error:
+                self.errors += 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "latency_ms": self.latency.snapshot(),
+        }
+
+
+clova_stats = {}
+
+
+def get_call_stats(endpoint: str) -> ClovaCallStats:
+    stats = clova_stats.get(endpoint)
+    if stats is None:
+        stats = clova_stats.setdefault(endpoint, ClovaCallStats())
+    return stats
+
+
+def clova_call_stats() -> dict:
+    return {endpoint: stats.snapshot() for endpoint, stats in clova_stats.items()}
+
+
+class MultipartStream:
+    """media 파일을 메모리에 올리지 않고 multipart/form-data 본문으로 스트리밍"""
+
+    def __init__(self, file_path: str, params: bytes):
+        boundary = uuid.uuid4().hex
+        file_name = os.path.basename(file_path)
+        self.head = (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="params"\r\n'
+            "Content-Type: application/json\r\n\r\n"
+        ).encode() + params
+        self.head += (
+            f"\r\n--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="media"; filename="{file_name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        self.tail = f"\r\n--{boundary}--\r\n".encode()
+        self.file_path = file_path
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.length = len(self.head) + os.path.getsize(file_path) + len(self.tail)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        yield self.head
+        with open(self.file_path, "rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield chunk
+        yield self.tail
+
+    def async_body(self) -> "AsyncMultipartBody":
+        return AsyncMultipartBody(self)
+
+
+class AsyncMultipartBody:
+    """
+    httpx.AsyncClient용 MultipartStream 본문
+    httpx는 __iter__가 있으면 sync 스트림으로 보내므로 __aiter__만 노출
+    """
+
+    def __init__(self, stream: MultipartStream):
+        self.stream = stream
+
+    async def __aiter__(self):
+        yield self.stream.head
+        with open(self.stream.file_path, "rb") as f:
+            while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+                yield chunk
+        yield self.stream.tail
+
+
+def is_retryable(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def backoff_seconds(attempt: int, response=None) -> float:
+    """Retry-After 헤더가 있으면 따르고, 없으면 full jitter 지수 백오프"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return random.uniform(0, settings.clova_backoff_seconds * (2**attempt))
 
 
 class ClovaApiClient:
     invoke_url = settings.clova_invoke_url
     secret = settings.clova_secret
 
-    def request_stt(
+    # 프로세스 내에서 keep-alive 커넥션을 재사용
+    _session = None
+    _async_client = None
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=settings.clova_pool_size,
+                pool_maxsize=settings.clova_pool_size,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
+
+    @classmethod
+    def async_client(cls) -> httpx.AsyncClient:
+        if cls._async_client is None:
+            cls._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    settings.clova_read_timeout,
+                    connect=settings.clova_connect_timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.clova_pool_size,
+                    max_keepalive_connections=settings.clova_pool_size,
+                ),
+            )
+        return cls._async_client
+
+    @classmethod
+    async def aclose(cls):
+        if cls._async_client is not None:
+            await cls._async_client.aclose()
+            cls._async_client = None
+        if cls._session is not None:
+            cls._session.close()
+            cls._session = None
+
+    def request_stt(self, file_path, **options):
+        return self._request(
+            "POST",
+            "/recognizer/upload",
+            lambda: self._upload_request(file_path, options),
+        )
+
+    def request_stt_url(self, url, **options):
+        """외부 URL(e.g. S3 presigned GET)의 미디어로 STT 요청"""
+        return self._request(
+            "POST", "/recognizer/url", lambda: self._url_request(url, options)
+        )
+
+    def get_result(self, token):
+        """completion="async" 요청의 진행 상태/결과 조회"""
+        return self._request(
+            "GET", f"/recognizer/{token}", self._result_request, "/recognizer/{token}"
+        )
+
+    async def arequest_stt(self, file_path, **options):
+        return await self._arequest(
+            "POST",
+            "/recognizer/upload",
+            lambda: self._upload_request(file_path, options),
+        )
+
+    async def arequest_stt_url(self, url, **options):
+        return await self._arequest(
+            "POST", "/recognizer/url", lambda: self._url_request(url, options)
+        )
+
+    async def aget_result(self, token):
+        return await self._arequest(
+            "GET", f"/recognizer/{token}", self._result_request, "/recognizer/{token}"
+        )
+
+    def _request_body(
         self,
-        file_path,
         completion="sync",
         callback=None,
         userdata=None,
@@ -21,7 +224,7 @@ class ClovaApiClient:
         fullText=True,
         diarization=None,
     ):
-        request_body = {
+        return {
             "language": "ko-KR",
             "completion": completion,
             "callback": callback,
@@ -32,20 +235,102 @@ class ClovaApiClient:
             "boostings": boostings,
             "diarization": diarization,
         }
-        headers = {
+
+    def _headers(self, content_type: str) -> dict:
+        return {
             "Accept": "application/json;UTF-8",
+            "Content-Type": content_type,
             "X-CLOVASPEECH-API-KEY": self.secret,
         }
-        print(json.dumps(request_body, ensure_ascii=False).encode("UTF-8"))
-        files = {
-            "media": open(file_path, "rb"),
-            "params": (
-                None,
-                json.dumps(request_body, ensure_ascii=False).encode("UTF-8"),
-                "application/json",
-            ),
-        }
-        response = requests.post(
-            headers=headers, url=self.invoke_url + "/recognizer/upload", files=files
-        )
-        return response
+
+    def _upload_request(self, file_path, options):
+        """재시도마다 새로 만들어야 하므로 (body, headers, size)를 반환"""
+        params = json.dumps(self._request_body(**options), ensure_ascii=False)
+        stream = MultipartStream(file_path, params.encode("UTF-8"))
+        headers = self._headers(stream.content_type)
+        headers["Content-Length"] = str(len(stream))
+        return stream, headers, len(stream)
+
+    def _url_request(self, url, options):
+        request_body = {"url": url, **self._request_body(**options)}
+        data = json.dumps(request_body, ensure_ascii=False).encode("UTF-8")
+        return data, self._headers("application/json"), len(data)
+
+    def _result_request(self):
+        return None, self._headers("application/json"), 0
+
+    def _request(self, method, endpoint, build_request, stats_key=None):
+        stats = get_call_stats(stats_key or endpoint)
+        for attempt in range(settings.clova_max_retries + 1):
+            data, headers, size = build_request()
+            start = time.perf_counter()
+            try:
+                response = self.session().request(
+                    method,
+                    self.invoke_url + endpoint,
+                    data=data,
+                    headers=headers,
+                    timeout=(
+                        settings.clova_connect_timeout,
+                        settings.clova_read_timeout,
+                    ),
+                )
+            except requests.ConnectionError as e:
+                # 요청이 전달되지 않은 경우만 재시도 (read timeout은 중복 과금 방지를 위해 재시도 안함)
+                stats.record((time.perf_counter() - start) * 1000, size, error=True)
+                if attempt == settings.clova_max_retries:
+                    raise e
+                logger.warning(f"Clova {endpoint} connection error, retrying: {e}")
+                stats.record_retry()
+                time.sleep(backoff_seconds(attempt))
+                continue
+
+            stats.record(
+                (time.perf_counter() - start) * 1000,
+                size,
+                error=response.status_code >= 400,
+            )
+            if (
+                is_retryable(response.status_code)
+                and attempt < settings.clova_max_retries
+            ):
+                logger.warning(f"Clova {endpoint} {response.status_code}, retrying")
+                stats.record_retry()
+                time.sleep(backoff_seconds(attempt, response))
+                continue
+            return response
+
+    async def _arequest(self, method, endpoint, build_request, stats_key=None):
+        stats = get_call_stats(stats_key or endpoint)
+        for attempt in range(settings.clova_max_retries + 1):
+            data, headers, size = build_request()
+            if isinstance(data, MultipartStream):
+                data = data.async_body()
+            start = time.perf_counter()
+            try:
+                response = await self.async_client().request(
+                    method, self.invoke_url + endpoint, content=data, headers=headers
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                stats.record((time.perf_counter() - start) * 1000, size, error=True)
+                if attempt == settings.clova_max_retries:
+                    raise e
+                logger.warning(f"Clova {endpoint} connection error, retrying: {e}")
+                stats.record_retry()
+                await asyncio.sleep(backoff_seconds(attempt))
+                continue
+
+            stats.record(
+                (time.perf_counter() - start) * 1000,
+                size,
+                error=response.status_code >= 400,
+            )
+            if (
+                is_retryable(response.status_code)
+                and attempt < settings.clova_max_retries
+            ):
+                logger.warning(f"Clova {endpoint} {response.status_code}, retrying")
+                stats.record_retry()
+                await asyncio.sleep(backoff_seconds(attempt, response))
+                continue
+            return response
@@ -0,0 +1,448 @@
+import asyncio
+import json
+import os
+import re
+import struct
+import subprocess
+import sys
+import threading
+from array import array
+from collections import deque
+
+from boto3.s3.transfer import TransferConfig
+
+from app.config import settings
+
+MB = 1024 * 1024
+STREAM_CHUNK_SIZE = 1 * MB
+
+# 이름별 인코딩 설정 (settings.audio_encoding_profile 로 선택)
+# 프로파일을 추가하면 app.config.EncodingProfileName 에도 추가
+ENCODING_PROFILES = {
+    # 기존 기본값
+    "aac-192k": {
+        "args": ["-acodec", "aac", "-b:a", "192k"],
+        "format": "mp4",
+        "extension": ".m4a",
+        "content_type": "audio/m4a",
+    },
+    # 모노 음성 녹음용
+    "speech-mono-96k": {
+        "args": ["-ac", "1", "-acodec", "aac", "-b:a", "96k"],
+        "format": "mp4",
+        "extension": ".m4a",
+        "content_type": "audio/m4a",
+    },
+    "speech-mono-64k": {
+        "args": ["-ac", "1", "-acodec", "aac", "-b:a", "64k"],
+        "format": "mp4",
+        "extension": ".m4a",
+        "content_type": "audio/m4a",
+    },
+    "opus-mono-32k": {
+        "args": [
+            "-ac",
+            "1",
+            "-acodec",
+            "libopus",
+            "-b:a",
+            "32k",
+            "-application",
+            "voip",
+        ],
+        "format": "ogg",
+        "extension": ".ogg",
+        "content_type": "audio/ogg",
+    },
+}
+
+
+def encoding_profile(name: str = None) -> dict:
+    name = name or settings.audio_encoding_profile
+    try:
+        return ENCODING_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown encoding profile {name!r}, "
+            f"choose one of {sorted(ENCODING_PROFILES)}"
+        )
+
+
+def converted_path(file_path: str, profile_name: str = None) -> str:
+    """변환 결과 경로 (확장자는 프로파일에 따름)"""
+    return os.path.splitext(file_path)[0] + encoding_profile(profile_name)["extension"]
+
+
+def audio_content_type(file_path: str) -> str:
+    extension = os.path.splitext(file_path)[1]
+    for profile in ENCODING_PROFILES.values():
+        if profile["extension"] == extension:
+            return profile["content_type"]
+    return "audio/m4a"
+
+
+def encode_command(
+    input_path: str, output_path: str, profile_name: str = None, audio_filter=None
+) -> list:
+    profile = encoding_profile(profile_name)
+    filter_args = ["-af", audio_filter] if audio_filter else []
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-i",
+        input_path,
+        "-vn",
+        *filter_args,
+        *profile["args"],
+        "-f",
+        profile["format"],
+        output_path,
+    ]
+
+
+def stream_command(profile_name: str = None) -> list:
+    """stdin -> stdout 변환 명령"""
+    profile = encoding_profile(profile_name)
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        "-vn",
+        *profile["args"],
+        "-f",
+        profile["format"],
+    ]
+    if profile["format"] == "mp4":
+        # 파이프 출력은 seek가 불가능하므로 moov를 앞에 두는 fragmented mp4로 출력
+        command += ["-movflags", "frag_keyframe+empty_moov+default_base_moof"]
+    return command + ["pipe:1"]
+
+
+async def run_ffmpeg(command: list, timeout: float = None) -> bytes:
+    """
+    ffmpeg/ffprobe를 asyncio subprocess로 실행 (이벤트 루프를 막지 않음)
+    timeout 초과 또는 작업 취소 시 프로세스를 종료합니다.
+    :return: stdout
+    """
+    timeout = timeout or settings.ffmpeg_timeout_seconds
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        await _kill(process)
+        raise Exception(f"{command[0]} timed out after {timeout}s")
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+    return stdout
+
+
+async def _kill(process):
+    if process.returncode is None:
+        process.kill()
+        await process.wait()
+
+
+async def probe_audio(source: str) -> dict:
+    """
+    ffprobe로 컨테이너 메타데이터만 읽어 오디오 정보를 반환 (디코딩 없음)
+    :param source: 로컬 경로 또는 URL (e.g. S3 presigned GET)
+    :return: duration(초), sample_rate, channels, bit_rate
+    """
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_format",
+        "-show_streams",
+        "-print_format",
+        "json",
+        source,
+    ]
+    data = json.loads(await run_ffmpeg(command))
+    stream = data["streams"][0] if data.get("streams") else {}
+    container = data.get("format", {})
+
+    duration = container.get("duration") or stream.get("duration")
+    bit_rate = stream.get("bit_rate") or container.get("bit_rate")
+    return {
+        "duration": float(duration) if duration else None,
+        "sample_rate": (
+            int(stream["sample_rate"]) if stream.get("sample_rate") else None
+        ),
+        "channels": stream.get("channels"),
+        "bit_rate": int(bit_rate) if bit_rate else None,
+    }
+
+
+async def detect_silences(
+    source: str, duration: float, noise_db: float, min_seconds: float
+) -> list:
+    """
+    silencedetect로 무음 구간 [(start, end)] 반환 (초 단위)
+    결과는 ametadata로 stdout에 출력하여 로그 레벨과 무관하게 파싱합니다.
+    """
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        source,
+        "-vn",
+        "-af",
+        f"silencedetect=noise={noise_db}dB:d={min_seconds},"
+        "ametadata=mode=print:file=-",
+        "-f",
+        "null",
+        "-",
+    ]
+    output = (await run_ffmpeg(command)).decode(errors="replace")
+    silences = []
+    start = None
+    for key, value in re.findall(r"lavfi\.silence_(start|end)=(-?[\d.]+)", output):
+        if key == "start":
+            start = max(float(value), 0.0)
+        elif start is not None:
+            silences.append((start, min(float(value), duration)))
+            start = None
+    # 파일 끝까지 이어지는 무음
+    if start is not None and start < duration:
+        silences.append((start, duration))
+    return silences
+
+
+async def extract_audio_range(source: str, start: float, end: float, output_path: str):
+    """start~end 구간을 재인코딩 없이 잘라 저장"""
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-ss",
+        f"{start:.3f}",
+        "-i",
+        source,
+        "-t",
+        f"{end - start:.3f}",
+        "-vn",
+        "-c",
+        "copy",
+        output_path,
+    ]
+    await run_ffmpeg(command)
+    return output_path
+
+
+async def trim_audio_regions(source: str, regions: list, output_path: str):
+    """
+    regions [(start, end)] 구간만 이어 붙인 STT용 오디오 생성 (frame 단위 정밀도)
+    인코딩은 현재 인코딩 프로파일을 따르므로 output_path 확장자도 프로파일에 맞춰야 함
+    """
+    expression = "+".join(f"between(t,{start:.3f},{end:.3f})" for start, end in regions)
+    audio_filter = f"aselect='{expression}',asetpts=N/SR/TB"
+    await run_ffmpeg(encode_command(source, output_path, audio_filter=audio_filter))
+    return output_path
+
+
+# peaks 파일: header("<4sHIH" magic, version, sample_rate, level 수)
+# + level별 ("<II" samples_per_bucket, bucket 수, int8 [min, max] x bucket 수)
+PEAKS_MAGIC = b"PEAK"
+PEAKS_VERSION = 1
+
+
+async def compute_peaks(source: str) -> bytes:
+    """
+    mono PCM으로 디코딩하여 bucket별 min/max를 구한 다중 해상도 peaks 바이너리 생성
+    stdout을 chunk 단위로 줄여가므로 메모리 사용량은 녹음 길이와 무관합니다.
+    :param source: 로컬 경로 또는 URL (e.g. S3 presigned GET)
+    """
+    sample_rate = settings.audio_peaks_sample_rate
+    samples_per_bucket = settings.audio_peaks_samples_per_bucket
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        source,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "-f",
+        "s16le",
+        "pipe:1",
+    ]
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        (mins, maxs), stderr = await asyncio.wait_for(
+            asyncio.gather(
+                _read_peaks(process.stdout, samples_per_bucket),
+                process.stderr.read(),
+            ),
+            settings.ffmpeg_timeout_seconds,
+        )
+        await process.wait()
+    except asyncio.TimeoutError:
+        await _kill(process)
+        raise Exception(f"ffmpeg timed out after {settings.ffmpeg_timeout_seconds}s")
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command, None, stderr)
+    return encode_peaks(sample_rate, samples_per_bucket, mins, maxs)
+
+
+async def _read_peaks(stdout, samples_per_bucket: int):
+    bucket_bytes = samples_per_bucket * 2
+    mins, maxs = array("b"), array("b")
+    pending = b""
+    while chunk := await stdout.read(STREAM_CHUNK_SIZE):
+        pending += chunk
+        usable = len(pending) - len(pending) % bucket_bytes
+        _reduce_samples(pending[:usable], samples_per_bucket, mins, maxs)
+        pending = pending[usable:]
+    # 마지막 bucket은 샘플 수가 모자랄 수 있음
+    _reduce_samples(
+        pending[: len(pending) - len(pending) % 2], samples_per_bucket, mins, maxs
+    )
+    return mins, maxs
+
+
+def _reduce_samples(data: bytes, samples_per_bucket: int, mins, maxs):
+    samples = array("h")
+    samples.frombytes(data)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    for i in range(0, len(samples), samples_per_bucket):
+        bucket = samples[i : i + samples_per_bucket]
+        mins.append(min(bucket) >> 8)
+        maxs.append(max(bucket) >> 8)
+
+
+def _halve(values, pick):
+    """인접한 두 bucket을 하나로 합침"""
+    merged = array("b", map(pick, values[0::2], values[1::2]))
+    if len(values) % 2:
+        merged.append(values[-1])
+    return merged
+
+
+def encode_peaks(sample_rate: int, samples_per_bucket: int, mins, maxs) -> bytes:
+    """bucket 수가 audio_peaks_min_buckets 이하가 될 때까지 해상도를 절반씩 줄여 level 추가"""
+    levels = [(samples_per_bucket, mins, maxs)]
+    while len(mins) > settings.audio_peaks_min_buckets:
+        mins, maxs = _halve(mins, min), _halve(maxs, max)
+        samples_per_bucket *= 2
+        levels.append((samples_per_bucket, mins, maxs))
+
+    parts = [
+        struct.pack("<4sHIH", PEAKS_MAGIC, PEAKS_VERSION, sample_rate, len(levels))
+    ]
+    for level_samples_per_bucket, level_mins, level_maxs in levels:
+        interleaved = array("b", bytes(len(level_mins) * 2))
+        interleaved[0::2] = level_mins
+        interleaved[1::2] = level_maxs
+        parts.append(struct.pack("<II", level_samples_per_bucket, len(level_mins)))
+        parts.append(interleaved.tobytes())
+    return b"".join(parts)
+
+
+def s3_transfer_config():
+    """S3 multipart 업로드 설정 (메모리 사용량 = part 크기 x 동시성)"""
+    chunk_size = settings.s3_multipart_chunk_mb * MB
+    return TransferConfig(
+        multipart_threshold=chunk_size,
+        multipart_chunksize=chunk_size,
+        max_concurrency=settings.s3_multipart_concurrency,
+    )
+
+
+def _feed_stdin(body, stdin):
+    """S3 GET body를 ffmpeg stdin으로 전달"""
+    try:
+        for chunk in body.iter_chunks(chunk_size=STREAM_CHUNK_SIZE):
+            stdin.write(chunk)
+    except (BrokenPipeError, ValueError):
+        # ffmpeg가 먼저 종료된 경우, 오류는 returncode로 판단
+        pass
+    finally:
+        body.close()
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def _drain_stderr(stderr, tail: deque):
+    for line in stderr:
+        tail.append(line.decode(errors="replace").strip())
+
+
+def transcode_s3_object(s3, bucket: str, src_key: str, dst_key: str):
+    """
+    S3 객체를 ffmpeg에 파이프로 흘려 설정된 프로파일로 변환하고 결과를 바로 S3 multipart 업로드
+    로컬 디스크를 사용하지 않으며 메모리 사용량은 녹음 길이와 무관합니다.
+    """
+    body = s3.get_object(Bucket=bucket, Key=src_key)["Body"]
+    process = subprocess.Popen(
+        stream_command(),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stderr_tail = deque(maxlen=20)
+    feeder = threading.Thread(
+        target=_feed_stdin, args=(body, process.stdin), daemon=True
+    )
+    drainer = threading.Thread(
+        target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True
+    )
+    # 스레드에서 실행되므로 timeout은 watchdog 타이머로 프로세스를 종료
+    watchdog = threading.Timer(settings.ffmpeg_timeout_seconds, process.kill)
+    feeder.start()
+    drainer.start()
+    watchdog.start()
+
+    try:
+        s3.upload_fileobj(process.stdout, bucket, dst_key, Config=s3_transfer_config())
+    except Exception:
+        process.kill()
+        raise
+    finally:
+        returncode = process.wait()
+        watchdog.cancel()
+        feeder.join()
+        drainer.join()
+
+    if returncode != 0:
+        # ffmpeg 실패 시 업로드된 불완전한 결과물 삭제
+        s3.delete_object(Bucket=bucket, Key=dst_key)
+        raise Exception(f"Failed to convert file to M4A: {' '.join(stderr_tail)}")
+    return dst_key
@@ -0,0 +1,45 @@
+from app.db.connection import postgresql_async_connection, postgresql_connection
+from app.db.query_metrics import query_stats, reset_query_stats
+from app.services.audio import playback_latency, time_to_transcript, vad_saved
+from app.services.audio_cache import audio_cache_stats
+from app.services.clova import clova_call_stats
+
+
+def get_db_pool_stats():
+    """DB 커넥션 풀 통계"""
+    return {
+        "sync": postgresql_connection.pool_stats(),
+        "async": postgresql_async_connection.pool_stats(),
+    }
+
+
+def get_db_query_stats():
+    """쿼리 상수별 실행 시간/row 수/에러 수 통계"""
+    return query_stats()
+
+
+def clear_db_query_stats():
+    reset_query_stats()
+
+
+def get_audio_pipeline_stats():
+    """업로드부터 STT 완료까지 걸린 시간 및 무음 제거로 줄인 STT 시간 통계"""
+    return {
+        "time_to_transcript_ms": time_to_transcript.snapshot(),
+        "vad_saved_ms": vad_saved.snapshot(),
+    }
+
+
+def get_clova_stats():
+    """Clova 엔드포인트별 latency/payload/재시도 통계"""
+    return clova_call_stats()
+
+
+def get_audio_cache_stats():
+    """재생용 오디오 캐시 hit rate/용량"""
+    return audio_cache_stats()
+
+
+def get_audio_playback_stats():
+    """/audio/webm/{id} 응답 모드별 처리 시간"""
+    return {mode: histogram.snapshot() for mode, histogram in playback_latency.items()}
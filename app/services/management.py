@@ -1,4 +1,9 @@
+import base64
 import datetime
+import json
+import time
+import uuid
+from collections import OrderedDict
 from typing import Optional
 from sqlalchemy import text
 
@@ -9,39 +14,79 @@ from app.db.query import (
     SELECT_AUDIO_INFO,
     SELECT_REPORTS_AUDIO_FILES,
     # SELECT_REPORTS_PAGINATED,
-    SELECT_TOTAL_COUNT,
     UPDATE_AUDIO_FILE_IS_USED,
     UPDATE_USER_REPORTS_INSPECTION,
     UPDATE_USER_REPORTS_INSPECTOR,
 )
 
 
-from app.db.worker import execute_insert_update_query, execute_select_query
+from app.db.worker import (
+    execute_insert_update_query,
+    execute_select_query,
+    execute_select_query_async,
+)
 from app.services.users import fetch_user_names
 
 supabase: Client = create_client(settings.supabase_url, settings.supabase_service_key)
 
 
-def calculate_progress(statuses):
-    total = len(statuses)
-    completed = statuses.count("COMPLETED")
+def calculate_progress(completed, total):
     progress = f"{completed}/{total}"
     return progress
 
 
-async def get_reports_with_pagination(
-    page: int,
-    page_size: int,
+# 집계 컬럼은 트리거로 갱신되는 user_reports_summary에서 읽음 (DDL.SQL 참고)
+REPORT_LIST_COLUMNS = """
+        user_reports.id AS user_reports_id,
+        user_reports.user_id AS user_id,
+        user_reports.send_at AS send_at,
+        user_reports.inspection AS inspection,
+        user_reports.inspector AS inspector,
+        user_reports.inspected_at AS inspected_at,
+        user_reports.status AS status,
+        NULL AS user_name,
+        summary.child_name AS child_name,
+        summary.report_title AS report_title,
+        summary.plan_name AS plans_name,
+        COALESCE(summary.mission_count, 0) AS mission_count,
+        COALESCE(summary.completed_mission_count, 0) AS completed_mission_count,
+        COALESCE(summary.audio_file_count, 0) AS audio_file_count,
+        COALESCE(summary.total_record_time, 0) AS total_record_time
+"""
+
+REPORT_LIST_JOINS = """
+    LEFT JOIN user_reports_summary summary
+        ON summary.user_reports_id = user_reports.id
+"""
+
+# 필터 조합별 total_count 캐시 {(inspection, status, plan_name): (만료 시각, count)}
+# plan_name 등 자유 입력 필터로 키가 늘어나므로 최근 사용 순으로 개수를 제한
+_report_count_cache = OrderedDict()
+
+
+def cache_report_count(cache_key, total_count: int, now: float):
+    """만료된 항목을 정리하고 최대 개수를 넘으면 오래 쓰지 않은 항목부터 제거"""
+    expired = [
+        key for key, (expires_at, _) in _report_count_cache.items() if expires_at <= now
+    ]
+    for key in expired:
+        del _report_count_cache[key]
+    _report_count_cache[cache_key] = (
+        now + settings.report_count_cache_seconds,
+        total_count,
+    )
+    _report_count_cache.move_to_end(cache_key)
+    while len(_report_count_cache) > settings.report_count_cache_size:
+        _report_count_cache.popitem(last=False)
+
+
+def build_report_filters(
     inspection_filter: Optional[str] = None,
     status_filter: Optional[str] = None,
     plan_name_filter: Optional[str] = None,
 ):
-    offset = (page - 1) * page_size
     where_clauses = []
-    query_params = {
-        "limit": page_size,
-        "offset": offset,
-    }
+    query_params = {}
 
     if inspection_filter:
         where_clauses.append("user_reports.inspection = :inspection_filter")
@@ -52,60 +97,53 @@ async def get_reports_with_pagination(
         query_params["status_filter"] = status_filter
 
     if plan_name_filter:
-        where_clauses.append("plans.plan_name = :plan_name_filter")
+        where_clauses.append("summary.plan_name = :plan_name_filter")
         query_params["plan_name_filter"] = plan_name_filter
 
-    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+    return where_clauses, query_params
+
 
+async def count_reports(
+    inspection_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    plan_name_filter: Optional[str] = None,
+) -> int:
+    """필터가 적용된 user_reports 수 (필터 조합별로 잠시 캐시)"""
+    cache_key = (inspection_filter, status_filter, plan_name_filter)
+    cached = _report_count_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and cached[0] > now:
+        _report_count_cache.move_to_end(cache_key)
+        return cached[1]
+
+    where_clauses, query_params = build_report_filters(
+        inspection_filter, status_filter, plan_name_filter
+    )
+    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+    # plan 필터가 없으면 summary join 없이 user_reports만 카운트
+    joins = REPORT_LIST_JOINS if plan_name_filter else ""
     sql_query = text(
         f"""
-    SELECT DISTINCT ON (user_reports.id)
-        user_reports.id AS user_reports_id,
-        user_reports.user_id AS user_id,
-        user_reports.send_at AS send_at,
-        user_reports.inspection AS inspection,
-        user_reports.inspector AS inspector,
-        user_reports.inspected_at AS inspected_at,
-        user_reports.status AS status,
-        NULL AS user_name,
-        user_children.first_name AS child_name,
-        reports.title AS report_title,
-        plans.plan_name AS plans_name,
-        (SELECT ARRAY_AGG(user_missions.status)
-         FROM user_missions
-         WHERE user_missions.user_reports_id = user_reports.id) AS mission_statuses,
-        (SELECT COUNT(audio_files.id)
-         FROM user_missions
-         JOIN audio_files ON audio_files.user_missions_id = user_missions.id
-         WHERE user_missions.user_reports_id = user_reports.id) AS audio_file_count,
-        (SELECT COALESCE(SUM(audio_files.record_time), 0)
-         FROM user_missions
-         JOIN audio_files ON audio_files.user_missions_id = user_missions.id
-         WHERE user_missions.user_reports_id = user_reports.id) AS total_record_time
-    FROM
-        user_reports
-    LEFT JOIN (
-        SELECT DISTINCT ON (user_reports_id) *
-        FROM user_missions
-        ORDER BY user_reports_id, created_at DESC
-    ) user_missions ON user_missions.user_reports_id = user_reports.id
-    LEFT JOIN user_plans ON user_missions.user_plans_id = user_plans.id
-    LEFT JOIN plans ON user_plans.plans_id = plans.id
-    LEFT JOIN user_children ON user_plans.user_children_id = user_children.id
-    LEFT JOIN reports ON user_reports.reports_id = reports.id
+    SELECT COUNT(*) AS total_count
+    FROM user_reports
+    {joins}
     WHERE {where_clause}
-    ORDER BY user_reports.id, user_reports.send_at DESC
-    LIMIT :limit OFFSET :offset
     """
     )
+    total_count_result = await execute_select_query_async(
+        query=sql_query, params=query_params
+    )
+    total_count = total_count_result[0]["total_count"] if total_count_result else 0
+    cache_report_count(cache_key, total_count, now)
+    return total_count
 
-    # 보고서 데이터 가져오기
-    reports = execute_select_query(query=sql_query, params=query_params)
+
+async def format_reports(reports):
     reports = [dict(report) for report in reports]
     user_ids = [report["user_id"] for report in reports]
     user_data = await fetch_user_names(user_ids)
 
-    # mission_statuses -> mission_progress로 변환 및 기타 데이터 포맷팅
+    # mission 개수 -> mission_progress로 변환 및 기타 데이터 포맷팅
     for report in reports:
         user_id = report["user_id"]
         report["user_name"] = user_data.get(user_id, "")
@@ -121,12 +159,49 @@ async def get_reports_with_pagination(
             )
 
         # mission_progress 계산 및 대체
-        statuses = report.pop("mission_statuses", [])
-        report["mission_progress"] = calculate_progress(statuses) if statuses else "0/0"
+        completed = report.pop("completed_mission_count")
+        total = report.pop("mission_count")
+        report["mission_progress"] = calculate_progress(completed, total)
+    return reports
 
-    # 총 보고서 수 계산
-    total_count_result = execute_select_query(query=SELECT_TOTAL_COUNT, params={})
-    total_count = total_count_result[0]["total_count"] if total_count_result else 0
+
+async def get_reports_with_pagination(
+    page: int,
+    page_size: int,
+    inspection_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    plan_name_filter: Optional[str] = None,
+):
+    offset = (page - 1) * page_size
+    where_clauses, query_params = build_report_filters(
+        inspection_filter, status_filter, plan_name_filter
+    )
+    query_params["limit"] = page_size
+    query_params["offset"] = offset
+
+    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+
+    sql_query = text(
+        f"""
+    SELECT
+    {REPORT_LIST_COLUMNS}
+    FROM
+        user_reports
+    {REPORT_LIST_JOINS}
+    WHERE {where_clause}
+    ORDER BY user_reports.id
+    LIMIT :limit OFFSET :offset
+    """
+    )
+
+    # 보고서 데이터 가져오기
+    reports = await execute_select_query_async(query=sql_query, params=query_params)
+    reports = await format_reports(reports)
+
+    # 필터가 적용된 총 보고서 수 계산
+    total_count = await count_reports(
+        inspection_filter, status_filter, plan_name_filter
+    )
     total_pages = (total_count + page_size - 1) // page_size
 
     return {
@@ -138,6 +213,90 @@ async def get_reports_with_pagination(
     }
 
 
+def encode_report_cursor(report) -> str:
+    payload = {
+        "send_at": report["send_at"].isoformat() if report["send_at"] else None,
+        "id": str(report["user_reports_id"]),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_report_cursor(cursor: str):
+    payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    send_at = payload["send_at"]
+    send_at = datetime.datetime.fromisoformat(send_at) if send_at else None
+    return send_at, uuid.UUID(payload["id"])
+
+
+async def get_reports_with_keyset(
+    page_size: int,
+    after: Optional[tuple] = None,
+    inspection_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    plan_name_filter: Optional[str] = None,
+):
+    """
+    send_at, id 기준 keyset(cursor) 페이지네이션
+    OFFSET을 쓰지 않으므로 뒤 페이지로 가도 조회 비용이 일정합니다.
+    :param after: decode_report_cursor로 얻은 (send_at, id), 이 row 다음부터 조회
+    """
+    where_clauses, query_params = build_report_filters(
+        inspection_filter, status_filter, plan_name_filter
+    )
+    query_params["limit"] = page_size
+
+    # 정렬: send_at DESC NULLS LAST, id DESC
+    if after:
+        cursor_send_at, cursor_id = after
+        query_params["cursor_id"] = cursor_id
+        if cursor_send_at is None:
+            where_clauses.append(
+                "(user_reports.send_at IS NULL AND user_reports.id < :cursor_id)"
+            )
+        else:
+            where_clauses.append(
+                """(
+        user_reports.send_at < :cursor_send_at
+        OR (user_reports.send_at = :cursor_send_at AND user_reports.id < :cursor_id)
+        OR user_reports.send_at IS NULL
+    )"""
+            )
+            query_params["cursor_send_at"] = cursor_send_at
+
+    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+
+    sql_query = text(
+        f"""
+    SELECT
+    {REPORT_LIST_COLUMNS}
+    FROM
+        user_reports
+    {REPORT_LIST_JOINS}
+    WHERE {where_clause}
+    ORDER BY user_reports.send_at DESC NULLS LAST, user_reports.id DESC
+    LIMIT :limit
+    """
+    )
+
+    reports = await execute_select_query_async(query=sql_query, params=query_params)
+    # 포맷팅 전에 마지막 row로 다음 cursor 생성
+    next_cursor = (
+        encode_report_cursor(reports[-1]) if len(reports) == page_size else None
+    )
+    reports = await format_reports(reports)
+
+    total_count = await count_reports(
+        inspection_filter, status_filter, plan_name_filter
+    )
+
+    return {
+        "reports": reports,
+        "total_count": total_count,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+
+
 def select_reports_audio_files(user_reports_id):
     datas = execute_select_query(
         query=SELECT_REPORTS_AUDIO_FILES,
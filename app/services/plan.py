@@ -34,7 +34,11 @@ from app.db.query import (
     UPDATE_PLAN_SCHEDULE_IMAGE,
     UPDATE_PLAN_THUMBNAIL_IMAGE,
 )
-from app.db.worker import execute_insert_update_query, execute_select_query
+from app.db.worker import (
+    execute_insert_update_query,
+    execute_select_query,
+    transaction,
+)
 from app.error.utils import generate_error_response
 
 supabase = create_client(settings.supabase_url, settings.supabase_service_key)
@@ -85,32 +89,21 @@ def select_mission(plans_id):
 
 
 def delete_plan(plans_id):
-    # 미션이 있는지 확인하는 쿼리 실행
-    mission = execute_select_query(
-        query=SELECT_MISSION,
-        params={
-            "plans_id": plans_id,
-        },
-    )
-    reports = execute_select_query(
-        query=SELECT_REPORTS,
-        params={
-            "plans_id": plans_id,
-        },
-    )
+    params = {
+        "plans_id": plans_id,
+    }
+    try:
+        with transaction() as db:
+            # 미션이 있는지 확인하는 쿼리 실행
+            mission = db.execute(SELECT_MISSION, params).mappings().all()
+            reports = db.execute(SELECT_REPORTS, params).mappings().all()
 
-    # 미션이 있을 경우 삭제 불가
-    if mission or reports:
-        return generate_error_response("MISSION_EXISTS")
+            # 미션이 있을 경우 삭제 불가
+            if mission or reports:
+                return generate_error_response("MISSION_EXISTS")
 
-    # 미션이 없을 경우 계획 삭제
-    try:
-        execute_insert_update_query(
-            query=DELETE_PLAN,
-            params={
-                "plans_id": plans_id,
-            },
-        )
+            # 미션이 없을 경우 계획 삭제
+            db.execute(DELETE_PLAN, params)
         delete_plan_image(plans_id)
         return generate_error_response("DELETE_SUCCESS")
     except Exception as e:
@@ -283,19 +276,12 @@ def update_mission_status(playload: dict):
 
 
 def delete_mission(mission_id):
-    execute_insert_update_query(
-        query=DELETE_MISSION_MESSAGE,
-        params={
-            "mission_id": mission_id,
-        },
-    )
-
-    execute_insert_update_query(
-        query=DELETE_MISSION,
-        params={
-            "mission_id": mission_id,
-        },
-    )
+    params = {
+        "mission_id": mission_id,
+    }
+    with transaction() as db:
+        db.execute(DELETE_MISSION_MESSAGE, params)
+        db.execute(DELETE_MISSION, params)
 
 
 def insert_mission(payload: dict):
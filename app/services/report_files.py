@@ -28,7 +28,11 @@ from app.db.query import (
     SELECT_STT_DATA_BETWEEN_DATE,
     UPDATE_REPORTS_ID,
 )
-from app.db.worker import execute_insert_update_query, execute_select_query
+from app.db.worker import (
+    execute_insert_update_query,
+    execute_select_query,
+    stream_select_query,
+)
 
 FONT_PATH = os.path.abspath("./NanumFontSetup_TTF_GOTHIC/NanumGothic.ttf")
 font_prop = font_manager.FontProperties(fname=FONT_PATH)
@@ -110,13 +114,17 @@ def analyze_text_with_mecab(text):
 
 def extract_speaker_data(data):
     """발화자별로 텍스트를 추출하여 하나의 문자열로 결합"""
-    if not isinstance(data, pd.DataFrame):
-        data = pd.DataFrame(data)
-    speaker_data = (
-        data.groupby("speaker")["text_edited"]
-        .apply(lambda texts: " ".join(texts.astype(str)))
-        .to_dict()
-    )
+    if isinstance(data, pd.DataFrame):
+        data = data.to_dict("records")
+    # row를 한 번만 순회하므로 stream_select_query 결과도 그대로 사용 가능
+    speaker_texts = {}
+    for row in data:
+        if row["speaker"] is None:
+            continue
+        speaker_texts.setdefault(row["speaker"], []).append(str(row["text_edited"]))
+    speaker_data = {
+        speaker: " ".join(speaker_texts[speaker]) for speaker in sorted(speaker_texts)
+    }
     return speaker_data
 
 
@@ -136,7 +144,7 @@ def create_morphs_data(user_id, start_date, end_date):
         "end_date": end_date,
     }
 
-    morphs_data = execute_select_query(
+    morphs_data = stream_select_query(
         query=SELECT_STT_DATA_BETWEEN_DATE, params=params
     )
 
@@ -622,17 +630,19 @@ def select_audio_id_stt_data(user_id, start_date, end_date):
     audio_files_id = execute_select_query(
         query=SELECT_AUDIO_FILES_BETWEEN_DATE, params=params
     )
-    stt_data = execute_select_query(query=SELECT_STT_DATA_BETWEEN_DATE, params=params)
+    stt_data = stream_select_query(query=SELECT_STT_DATA_BETWEEN_DATE, params=params)
     return audio_files_id, stt_data
 
 
 def group_stt_data_by_file_name(audio_files_id, stt_data):
+    rows_by_audio_files_id = {file["id"]: [] for file in audio_files_id}
+    for data in stt_data:
+        rows = rows_by_audio_files_id.get(data["audio_files_id"])
+        if rows is not None:
+            rows.append(dict(data))
     grouped_data = {}
     for file in audio_files_id:
-        file_name = file["file_name"]
-        grouped_data[file_name] = [
-            data for data in stt_data if data["audio_files_id"] == file["id"]
-        ]
+        grouped_data[file["file_name"]] = rows_by_audio_files_id[file["id"]]
     return grouped_data
 
 
@@ -31,11 +31,16 @@ from app.db.query import (
     UPDATE_TEXT_EDITED,
     UPDATE_PROMPT,
 )
-from app.db.worker import execute_insert_update_query, execute_select_query
+from app.db.worker import (
+    execute_insert_update_query,
+    execute_select_query,
+    execute_select_query_async,
+    transaction,
+)
 
 
-def select_stt_data_by_audio_files_id(audio_files_id):
-    return execute_select_query(
+async def select_stt_data_by_audio_files_id(audio_files_id):
+    return await execute_select_query_async(
         query=SELECT_STT_DATA,
         params={
             "audio_files_id": audio_files_id,
@@ -65,64 +70,67 @@ def select_text_edited_data(audio_files_id):
 
 
 def update_text_edit(id, audio_files_id, new_text, new_speaker):
-    execute_insert_update_query(
-        query=UPDATE_TEXT_EDITED,
-        params={
-            "id": id,
-            "audio_files_id": audio_files_id,
-            "new_text": new_text,
-            "new_speaker": new_speaker,
-        },
-    )
     edited_at = datetime.datetime.now()
-    execute_insert_update_query(
-        query=UPDATE_AUDIO_FILES_IS_EDIT,
-        params={
-            "audio_files_id": audio_files_id,
-            "is_edited": True,
-            "edited_at": edited_at,
-        },
-    )
+    with transaction() as db:
+        db.execute(
+            UPDATE_TEXT_EDITED,
+            {
+                "id": id,
+                "audio_files_id": audio_files_id,
+                "new_text": new_text,
+                "new_speaker": new_speaker,
+            },
+        )
+        db.execute(
+            UPDATE_AUDIO_FILES_IS_EDIT,
+            {
+                "audio_files_id": audio_files_id,
+                "is_edited": True,
+                "edited_at": edited_at,
+            },
+        )
 
 
 def update_replace_text_edit(audio_files_id, old_text, new_text):
-    execute_insert_update_query(
-        query=UPDATE_REPLACE_TEXT_EDITED,
-        params={
-            "audio_files_id": audio_files_id,
-            "old_text": old_text,
-            "new_text": new_text,
-        },
-    )
     edited_at = datetime.datetime.now()
-    execute_insert_update_query(
-        query=UPDATE_AUDIO_FILES_IS_EDIT,
-        params={
-            "audio_files_id": audio_files_id,
-            "is_edited": True,
-            "edited_at": edited_at,
-        },
-    )
+    with transaction() as db:
+        db.execute(
+            UPDATE_REPLACE_TEXT_EDITED,
+            {
+                "audio_files_id": audio_files_id,
+                "old_text": old_text,
+                "new_text": new_text,
+            },
+        )
+        db.execute(
+            UPDATE_AUDIO_FILES_IS_EDIT,
+            {
+                "audio_files_id": audio_files_id,
+                "is_edited": True,
+                "edited_at": edited_at,
+            },
+        )
 
 
 def update_replace_speaker(audio_files_id, old_speaker, new_speaker):
-    execute_insert_update_query(
-        query=UPDATE_REPLACE_SPEAKER,
-        params={
-            "audio_files_id": audio_files_id,
-            "old_speaker": old_speaker,
-            "new_speaker": new_speaker,
-        },
-    )
     edited_at = datetime.datetime.now()
-    execute_insert_update_query(
-        query=UPDATE_AUDIO_FILES_IS_EDIT,
-        params={
-            "audio_files_id": audio_files_id,
-            "is_edited": True,
-            "edited_at": edited_at,
-        },
-    )
+    with transaction() as db:
+        db.execute(
+            UPDATE_REPLACE_SPEAKER,
+            {
+                "audio_files_id": audio_files_id,
+                "old_speaker": old_speaker,
+                "new_speaker": new_speaker,
+            },
+        )
+        db.execute(
+            UPDATE_AUDIO_FILES_IS_EDIT,
+            {
+                "audio_files_id": audio_files_id,
+                "is_edited": True,
+                "edited_at": edited_at,
+            },
+        )
 
 
 def add_row_stt_data(audio_files_id, selected_text_order):
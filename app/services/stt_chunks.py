@@ -0,0 +1,61 @@
+from collections import defaultdict
+
+
+def plan_chunks(duration: float, silences: list, target_seconds: float) -> list:
+    """
+    target_seconds 근처의 무음 구간 중간에서 잘라 [(start, end)] 목록 생성
+    target의 0.5~1.5배 범위에 무음이 없으면 target 위치에서 자름
+    """
+    midpoints = [(start + end) / 2 for start, end in silences]
+    chunks = []
+    position = 0.0
+    # 마지막 chunk가 너무 짧아지지 않도록 1.5배 이상 남았을 때만 자름
+    while duration - position > target_seconds * 1.5:
+        ideal = position + target_seconds
+        candidates = [
+            midpoint
+            for midpoint in midpoints
+            if position + target_seconds * 0.5
+            <= midpoint
+            <= position + target_seconds * 1.5
+        ]
+        cut = min(candidates, key=lambda m: abs(m - ideal)) if candidates else ideal
+        chunks.append((position, cut))
+        position = cut
+    chunks.append((position, duration))
+    return chunks
+
+
+def offset_segments(segments: list, offset_ms: int) -> list:
+    """rename_keys를 거친 chunk 세그먼츠의 시간을 원본 오디오 기준으로 이동"""
+    for segment in segments:
+        segment["start_time"] += offset_ms
+        segment["end_time"] += offset_ms
+        # words: [[start, end, text], ...]
+        for word in segment.get("words") or []:
+            if isinstance(word, list) and len(word) >= 2:
+                word[0] += offset_ms
+                word[1] += offset_ms
+    return segments
+
+
+def relabel_speakers(segments: list) -> list:
+    """
+    chunk마다 독립적으로 붙은 화자 번호를 발화 시간 순위로 다시 매김
+    (가장 많이 말한 화자 = "1"), chunk 간 같은 화자가 같은 번호를 갖도록 하는 휴리스틱
+    """
+    spoken = defaultdict(int)
+    for segment in segments:
+        spoken[segment["speaker"]["label"]] += (
+            segment["end_time"] - segment["start_time"]
+        )
+    ranking = sorted(spoken, key=spoken.get, reverse=True)
+    labels = {label: str(rank) for rank, label in enumerate(ranking, start=1)}
+    for segment in segments:
+        label = labels[segment["speaker"]["label"]]
+        segment["speaker"] = {
+            **segment["speaker"],
+            "label": label,
+            "name": chr(ord("A") + int(label) - 1),
+        }
+    return segments
@@ -0,0 +1,52 @@
+from bisect import bisect_right
+
+
+def plan_speech_regions(duration: float, silences: list, keep_seconds: float):
+    """
+    무음 구간의 앞뒤 keep_seconds/2 만 남기고 잘라낸 뒤 남는 발화 구간 계산
+    :return: (regions [(start, end)], offset_map [(trimmed_start, original_start)])
+    """
+    half = keep_seconds / 2
+    regions = []
+    position = 0.0
+    for start, end in silences:
+        cut_start, cut_end = start + half, end - half
+        if cut_end <= cut_start or cut_start < position:
+            continue
+        if cut_start > position:
+            regions.append((position, cut_start))
+        position = cut_end
+    if position < duration:
+        regions.append((position, duration))
+
+    offset_map = []
+    trimmed = 0.0
+    for start, end in regions:
+        offset_map.append((trimmed, start))
+        trimmed += end - start
+    return regions, offset_map
+
+
+def trimmed_duration(regions: list) -> float:
+    return sum(end - start for start, end in regions)
+
+
+def to_original_ms(time_ms: int, offset_map: list) -> int:
+    """잘라낸 오디오 기준 시간(ms)을 원본 오디오 기준으로 변환"""
+    seconds = time_ms / 1000
+    index = max(bisect_right([start for start, _ in offset_map], seconds) - 1, 0)
+    trimmed_start, original_start = offset_map[index]
+    return round((original_start + seconds - trimmed_start) * 1000)
+
+
+def restore_offsets(segments: list, offset_map: list) -> list:
+    """rename_keys를 거친 세그먼츠의 시간을 원본 오디오 기준으로 되돌림"""
+    for segment in segments:
+        segment["start_time"] = to_original_ms(segment["start_time"], offset_map)
+        segment["end_time"] = to_original_ms(segment["end_time"], offset_map)
+        # words: [[start, end, text], ...]
+        for word in segment.get("words") or []:
+            if isinstance(word, list) and len(word) >= 2:
+                word[0] = to_original_ms(word[0], offset_map)
+                word[1] = to_original_ms(word[1], offset_map)
+    return segments
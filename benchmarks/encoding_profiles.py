@@ -0,0 +1,122 @@
+"""
+인코딩 프로파일별 변환 시간 / 결과 크기 / STT confidence 비교 벤치마크
+
+sample corpus 디렉토리의 녹음 파일(webm 등)을 프로파일마다 변환하여 아래 값을 출력합니다.
+- encode_s  : 변환 시간 합계, realtime: 녹음 길이 / 변환 시간
+- size_mb   : 결과 파일 크기 합계, kbps: 평균 비트레이트
+- confidence: STT 세그먼츠 confidence 평균 (--stt-url 지정 시)
+
+STT는 실제 Clova 대신 같은 /recognizer/upload API를 제공하는 로컬 stand-in 서버로 요청합니다.
+
+실행:
+    poetry run python -m benchmarks.encoding_profiles --corpus ./samples
+    poetry run python -m benchmarks.encoding_profiles --corpus ./samples \
+        --profiles aac-192k speech-mono-64k opus-mono-32k \
+        --stt-url http://localhost:8100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from app.services.audio import rename_keys
+from app.services.clova import ClovaApiClient
+from app.services.ffmpeg import (
+    ENCODING_PROFILES,
+    converted_path,
+    encode_command,
+    probe_audio,
+    run_ffmpeg,
+)
+
+AUDIO_EXTENSIONS = (".webm", ".m4a", ".mp3", ".ogg", ".wav")
+
+
+def list_corpus(corpus: str) -> list:
+    return sorted(
+        os.path.join(corpus, name)
+        for name in os.listdir(corpus)
+        if name.lower().endswith(AUDIO_EXTENSIONS)
+    )
+
+
+def stt_confidences(client: ClovaApiClient, file_path: str) -> list:
+    response = client.request_stt(file_path=file_path)
+    segments = json.loads(response.text).get("segments") or []
+    return (
+        [segment["confidence"] for segment in rename_keys(segments)] if segments else []
+    )
+
+
+async def measure(profile_name, sources, output_dir, client):
+    encode_seconds = audio_seconds = 0.0
+    size = 0
+    confidences = []
+    for source in sources:
+        output_path = os.path.join(
+            output_dir, converted_path(os.path.basename(source), profile_name)
+        )
+        start = time.perf_counter()
+        await run_ffmpeg(encode_command(source, output_path, profile_name))
+        encode_seconds += time.perf_counter() - start
+        # 브라우저 webm은 길이 메타데이터가 없는 경우가 많아 결과 파일에서 읽음
+        audio_seconds += (await probe_audio(output_path))["duration"] or 0.0
+        size += os.path.getsize(output_path)
+        if client:
+            confidences += stt_confidences(client, output_path)
+    return {
+        "profile": profile_name,
+        "files": len(sources),
+        "encode_s": encode_seconds,
+        "realtime": audio_seconds / encode_seconds if encode_seconds else 0.0,
+        "size_mb": size / 1024 / 1024,
+        "kbps": size * 8 / 1000 / audio_seconds if audio_seconds else 0.0,
+        "confidence": sum(confidences) / len(confidences) if confidences else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", required=True)
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(ENCODING_PROFILES),
+        choices=ENCODING_PROFILES,
+    )
+    parser.add_argument("--stt-url", help="로컬 Clova stand-in 주소 (없으면 STT 생략)")
+    parser.add_argument("--keep", help="변환 결과를 남길 디렉토리")
+    args = parser.parse_args()
+
+    sources = list_corpus(args.corpus)
+    if not sources:
+        parser.error(f"No audio files in {args.corpus}")
+
+    client = None
+    if args.stt_url:
+        client = ClovaApiClient()
+        client.invoke_url = args.stt_url.rstrip("/")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for profile_name in args.profiles:
+            output_dir = os.path.join(args.keep or temp_dir, profile_name)
+            os.makedirs(output_dir, exist_ok=True)
+            result = asyncio.run(measure(profile_name, sources, output_dir, client))
+            confidence = (
+                f"{result['confidence']:.3f}"
+                if result["confidence"] is not None
+                else "-"
+            )
+            print(
+                f"{result['profile']:<16} files={result['files']} "
+                f"encode_s={result['encode_s']:.2f} realtime={result['realtime']:.1f}x "
+                f"size_mb={result['size_mb']:.2f} kbps={result['kbps']:.1f} "
+                f"confidence={confidence}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+요청 1건당 DB에 전달되는 statement 수 비교 벤치마크
+
+before: 쿼리마다 SET TIME ZONE을 먼저 실행하던 기존 방식
+after : 커넥션 생성 시 타임존을 설정하는 현재 방식 (app.db.worker)
+
+실행:
+    poetry run python -m benchmarks.statement_count --requests 50
+"""
+
+import argparse
+import time
+
+from sqlalchemy import event, text
+
+from app.db.connection import postgresql_connection
+from app.db.query import SELECT_ACT_TYPES, SELECT_SPEECH_ACTS, SELECT_TALK_MORE
+from app.db.worker import execute_select_query
+
+# STT 편집 화면 진입 시 호출되는 조회 쿼리들
+TYPICAL_REQUEST = [SELECT_SPEECH_ACTS, SELECT_TALK_MORE, SELECT_ACT_TYPES]
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def legacy_select_query(query, params=None):
+    """기존 worker 동작 재현 (쿼리마다 SET TIME ZONE)"""
+    with postgresql_connection.get_db() as db:
+        db.execute(text("SET TIME ZONE 'Asia/Seoul'"))
+        result = db.execute(query, params)
+        return [record for record in result.mappings()]
+
+
+def run(select_query, requests: int, counter: StatementCounter):
+    counter.count = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        for query in TYPICAL_REQUEST:
+            select_query(query)
+    elapsed = time.perf_counter() - start
+    return {
+        "statements_per_request": counter.count / requests,
+        "ms_per_request": elapsed * 1000 / requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    counter = StatementCounter(postgresql_connection.engine)
+    # 커넥션 생성 비용이 결과에 섞이지 않도록 워밍업
+    run(execute_select_query, 1, counter)
+
+    results = {
+        "before": run(legacy_select_query, args.requests, counter),
+        "after": run(execute_select_query, args.requests, counter),
+    }
+    for mode, result in results.items():
+        print(
+            f"{mode:<7} statements/request={result['statements_per_request']:.1f} "
+            f"ms/request={result['ms_per_request']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+stt_data 적재 속도 비교 벤치마크 (rows/sec)
+
+loop: segment마다 execute_insert_update_query를 호출하던 기존 방식
+bulk: insert_stt_data의 단일 트랜잭션 executemany 방식
+
+벤치마크용 audio_files row를 지정해야 하며, 적재된 stt_data는 측정 후 삭제됩니다.
+
+실행:
+    poetry run python -m benchmarks.stt_ingestion --audio-files-id <uuid> --rows 1000
+"""
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.db.query import INSERT_STT_DATA
+from app.db.worker import execute_insert_update_query
+from app.services.audio import insert_stt_data
+
+DELETE_BENCHMARK_STT_DATA = text(
+    """
+    DELETE FROM stt_data
+    WHERE audio_files_id = :audio_files_id
+    """
+)
+
+
+def make_segments(audio_files_id: str, rows: int) -> list:
+    return [
+        {
+            "audio_files_id": audio_files_id,
+            "text_order": text_order,
+            "start_time": text_order * 1000,
+            "end_time": text_order * 1000 + 900,
+            "text": "벤치마크 문장",
+            "confidence": 0.95,
+            "speaker": "1",
+            "text_edited": "벤치마크 문장",
+        }
+        for text_order in range(1, rows + 1)
+    ]
+
+
+def legacy_insert(data_list):
+    for segment_data in data_list:
+        execute_insert_update_query(query=INSERT_STT_DATA, params=segment_data)
+
+
+def measure(insert, data_list, audio_files_id):
+    start = time.perf_counter()
+    insert(data_list)
+    elapsed = time.perf_counter() - start
+    execute_insert_update_query(
+        query=DELETE_BENCHMARK_STT_DATA, params={"audio_files_id": audio_files_id}
+    )
+    return len(data_list) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--audio-files-id", required=True)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    data_list = make_segments(args.audio_files_id, args.rows)
+    for mode, insert in (("loop", legacy_insert), ("bulk", insert_stt_data)):
+        rows_per_sec = measure(insert, data_list, args.audio_files_id)
+        print(f"{mode:<5} rows={args.rows} rows/sec={rows_per_sec:.1f}")
+
+
+if __name__ == "__main__":
+    main()
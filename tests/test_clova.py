@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+
+import httpx
+
+# app.config.Settings 필수 값 (실제 연결은 하지 않음)
+for name in (
+    "POSTGRESQL_URL",
+    "CLOVA_SECRET",
+    "FASTAPI_NAME",
+    "FASTAPI_KEY",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "BUCKET_NAME",
+    "SUPABASE_URL",
+    "SUPABASE_KEY",
+    "SUPABASE_SERVICE_KEY",
+    "SUPABASE_JWT_KEY",
+    "OPENAI_API_KEY",
+):
+    os.environ.setdefault(name, "test")
+os.environ.setdefault("CLOVA_INVOKE_URL", "https://clova.test")
+
+from app.services.clova import ClovaApiClient  # noqa: E402
+
+
+class ArequestSttTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json={"segments": []})
+
+        ClovaApiClient._async_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        media = tempfile.NamedTemporaryFile(suffix=".m4a", delete=False)
+        media.write(b"\x00audio-bytes\xff" * 1000)
+        media.close()
+        self.media_path = media.name
+
+    async def asyncTearDown(self):
+        await ClovaApiClient.aclose()
+        os.remove(self.media_path)
+
+    async def test_streams_multipart_upload(self):
+        response = await ClovaApiClient().arequest_stt(file_path=self.media_path)
+
+        self.assertEqual(response.status_code, 200)
+        request = self.requests[0]
+        self.assertEqual(request.url, "https://clova.test/recognizer/upload")
+        body = request.content
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        self.assertNotIn("Transfer-Encoding", request.headers)
+
+        boundary = request.headers["Content-Type"].split("boundary=")[1]
+        parts = body.split(f"--{boundary}".encode())
+        params = json.loads(parts[1].split(b"\r\n\r\n", 1)[1].rstrip(b"\r\n"))
+        self.assertEqual(params["completion"], "sync")
+        media = parts[2].split(b"\r\n\r\n", 1)[1][: -len(b"\r\n")]
+        with open(self.media_path, "rb") as f:
+            self.assertEqual(media, f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()